@@ -13,7 +13,7 @@ from openpyxl.utils.exceptions import InvalidFileException
 from zipfile import BadZipFile
 
 from .range import Range
-from .match import Comparator, RangeMatch, CellMatch, Operator
+from .match import Comparator, RangeMatch, CellMatch, Operator, get_comparator
 from .target import Target
 
 class GlobalKeys:
@@ -202,9 +202,9 @@ def run(target_workbook : Workbook, source_directory : str, source_file : str =
 
     block_match = RangeMatch(
         name="block",
-        sheet=Comparator(Operator.EQUAL, config_sheet),
+        sheet=get_comparator(Operator.EQUAL, config_sheet),
         start_cell=CellMatch("key",
-            value=Comparator(
+            value=get_comparator(
                 Operator.REGEX, r'^\s*(' + '|'.join(
                     (GlobalKeys.DIRECTORY, GlobalKeys.FILE, MatchKeys.NAME,)
                 ) + r')\s*$'
@@ -372,7 +372,7 @@ def parse_comparator(operator : str, value : Any) -> Comparator:
     op = Operators.get(operator.strip().lower(), None)
     assert op is not None, "Operator `%s` not recognised" % operator
     
-    return Comparator(op, value)
+    return get_comparator(op, value)
 
 def extract_directory(block : Dict[str, Comparator]) -> str:
     """Extract directory path from block
@@ -382,7 +382,7 @@ def extract_directory(block : Dict[str, Comparator]) -> str:
     if comp is None:
         return None
         
-    assert isinstance(comp.value, (str, bytes,)) and comp.operator == Operator.EQUAL, \
+    assert isinstance(comp.value, (str, bytes,)) and comp.operator is Operator.EQUAL, \
         "Directory block must use operator `is` and a string value"
     
     # When on Windows, do like the Windowsians
@@ -413,11 +413,11 @@ def extract_filename(block : Dict[str, Comparator], current_directory : str) ->
     match = None
 
     for f in reversed(files):
-        if comp.operator == Operator.EQUAL:
+        if comp.operator is Operator.EQUAL:
             if comp.value.lower() == f.lower():
                 match = filename = f
                 break
-        elif comp.operator == Operator.REGEX:
+        elif comp.operator is Operator.REGEX:
             match = comp.match(f)
             if match is not None:
                 filename = f
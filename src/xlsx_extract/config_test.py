@@ -10,6 +10,7 @@ from typing import Any, Tuple
 
 from .match import CellMatch, Comparator, Operator, RangeMatch
 from .target import Target
+from .testing import requires_assertions
 
 from .config import (
     Prefix,
@@ -39,19 +40,16 @@ def test_extract_directory():
         'directory': Comparator(Operator.EQUAL, "/foo/bar")
     }) == "/foo/bar"
 
+@requires_assertions
+@pytest.mark.parametrize("directory", [
+    Comparator(Operator.EQUAL, 13),
+    Comparator(Operator.REGEX, "/foo/bar/${stuff}/bar"),
+    Comparator(Operator.NOT_EQUAL, "/foo/bar"),
+])
+def test_extract_directory_invalid(directory):
     with pytest.raises(AssertionError):
         extract_directory({
-            'directory': Comparator(Operator.EQUAL, 13)
-        })
-
-    with pytest.raises(AssertionError):
-        extract_directory({
-            'directory': Comparator(Operator.REGEX, "/foo/bar/${stuff}/bar")
-        })
-
-    with pytest.raises(AssertionError):
-        extract_directory({
-            'directory': Comparator(Operator.NOT_EQUAL, "/foo/bar")
+            'directory': directory
         })
 
 def test_parse_comparator():
@@ -159,76 +157,67 @@ def test_parse_block():
         bar=Comparator(Operator.NOT_EQUAL, "four bar"),
     )
 
-def test_extract_filename():
-    
+@pytest.fixture(scope="module")
+def current_directory():
     with tempfile.TemporaryDirectory() as current_directory:
 
-        d = lambda f: os.path.join(current_directory, f)
-
         # Create some test files
         for filename in ('test1.xlsx', 'test2.xlsx', 'foo.xlsx', 'bar.txt', 'baz.xlsx',):
             time.sleep(0.01) # space out modified time - regex match should use most recent
-            with open(d(filename), 'w') as fp:
+            with open(os.path.join(current_directory, filename), 'w') as fp:
                 fp.write('test')
-        
-        # invalid arguments
-
-        with pytest.raises(AssertionError):
-            extract_filename(dict(
-                file=Comparator(Operator.EQUAL, 1)
-            ), current_directory)
-        
-        with pytest.raises(AssertionError):
-            extract_filename(dict(
-                file=Comparator(Operator.EQUAL, None)
-            ), current_directory)
-        
-        with pytest.raises(AssertionError):
-            extract_filename(dict(
-                file=Comparator(Operator.NOT_EQUAL, "test1.xlsx")
-            ), current_directory)
 
-        # equality match
+        yield current_directory
 
-        assert extract_filename(dict(
-            file=Comparator(Operator.EQUAL, "test1.xlsx")
-        ), current_directory) == (d('test1.xlsx'), 'test1.xlsx')
-
-        assert extract_filename(dict(
-            file=Comparator(Operator.EQUAL, "TEST1.xlsx")
-        ), current_directory) == (d('test1.xlsx'), 'test1.xlsx')
-
-        with pytest.raises(AssertionError):
-            extract_filename(dict(
-                file=Comparator(Operator.EQUAL, "notfound.xlsx")
-            ), current_directory)
-
-        # do not allow directory inline
-
-        with pytest.raises(AssertionError):
-            extract_filename(dict(
-                file=Comparator(Operator.EQUAL, d('test1.xlsx'))
-            ), current_directory)
-        
-        with pytest.raises(AssertionError):
-            extract_filename(dict(
-                file=Comparator(Operator.EQUAL, '../test1.xlsx')
-            ), current_directory)
-
-        # regex match (test2 is a tiny but more recently modified than test 1)
-
-        assert extract_filename(dict(
-            file=Comparator(Operator.REGEX, r"(test)[0-9]\.xlsx")
-        ), current_directory) == (d('test2.xlsx'), 'test')
+def test_extract_filename(current_directory):
+    
+    d = lambda f: os.path.join(current_directory, f)
+
+    # equality match
+
+    assert extract_filename(dict(
+        file=Comparator(Operator.EQUAL, "test1.xlsx")
+    ), current_directory) == (d('test1.xlsx'), 'test1.xlsx')
+
+    assert extract_filename(dict(
+        file=Comparator(Operator.EQUAL, "TEST1.xlsx")
+    ), current_directory) == (d('test1.xlsx'), 'test1.xlsx')
+
+    # regex match (test2 is a tiny but more recently modified than test 1)
+
+    assert extract_filename(dict(
+        file=Comparator(Operator.REGEX, r"(test)[0-9]\.xlsx")
+    ), current_directory) == (d('test2.xlsx'), 'test')
+
+    assert extract_filename(dict(
+        file=Comparator(Operator.REGEX, r"(TEST)[0-9]\.xlsx")
+    ), current_directory) == (d('test2.xlsx'), 'test')
+
+# Filenames `extract_filename()` rejects: invalid arguments, names that are not
+# found, and names that include a directory
+EXTRACT_FILENAME_INVALID = [
+    Comparator(Operator.EQUAL, 1),
+    Comparator(Operator.EQUAL, None),
+    Comparator(Operator.NOT_EQUAL, "test1.xlsx"),
+    Comparator(Operator.EQUAL, "notfound.xlsx"),
+    Comparator(Operator.REGEX, r"notfound\.xlsx"),
+    Comparator(Operator.EQUAL, '../test1.xlsx'),
+]
+
+@requires_assertions
+@pytest.mark.parametrize("file", EXTRACT_FILENAME_INVALID)
+def test_extract_filename_invalid(current_directory, file):
+    with pytest.raises(AssertionError):
+        extract_filename(dict(file=file), current_directory)
 
-        assert extract_filename(dict(
-            file=Comparator(Operator.REGEX, r"(TEST)[0-9]\.xlsx")
-        ), current_directory) == (d('test2.xlsx'), 'test')
+@requires_assertions
+def test_extract_filename_absolute(current_directory):
 
-        with pytest.raises(AssertionError):
-            extract_filename(dict(
-                file=Comparator(Operator.REGEX, r"notfound\.xlsx")
-            ), current_directory)
+    # do not allow directory inline
+    with pytest.raises(AssertionError):
+        extract_filename(dict(
+            file=Comparator(Operator.EQUAL, os.path.join(current_directory, 'test1.xlsx'))
+        ), current_directory)
 
 def test_cast_col():
 
@@ -236,11 +225,11 @@ def test_cast_col():
     assert cast_col(4) == 4
     assert cast_col(None) is None
 
+@requires_assertions
+@pytest.mark.parametrize("col", [3.2, "zebra"])
+def test_cast_col_invalid(col):
     with pytest.raises(AssertionError):
-        cast_col(3.2)
-    
-    with pytest.raises(AssertionError):
-        cast_col("zebra")
+        cast_col(col)
 
 def test_contains_cell_match():
 
@@ -522,6 +511,10 @@ def test_extract_source_match():
         'table': Comparator(Operator.EQUAL, "B3:D6"),
     }) == None
 
+@requires_assertions
+def test_extract_source_match_invalid():
+
+    # Cell and table are mutually exclusive
     with pytest.raises(AssertionError):
         extract_source_match({
             'name': Comparator(Operator.EQUAL, "foo"),
@@ -572,11 +565,15 @@ def test_extract_target():
         target_col=CellMatch(name="bar:target_col", value=Comparator(Operator.EQUAL, "gamma")),
     )
 
+@requires_assertions
+def test_extract_target_invalid():
+
+    # Target cell and table are mutually exclusive
     with pytest.raises(AssertionError):
         extract_target({
             'target cell': Comparator(Operator.EQUAL, 'Baz'),
             'target table': Comparator(Operator.EQUAL, 'Baz'),
-        }, source_cell_match)
+        }, CellMatch(name="foo", reference="Foo"))
 
 def test_run():
     directory = os.path.join(os.path.dirname(__file__), 'test_data')
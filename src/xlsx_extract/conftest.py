@@ -0,0 +1,31 @@
+import copyreg
+import pytest
+
+from openpyxl.worksheet.table import TableList
+
+from .testing import load_test_workbook
+
+# `TableList.items()` returns `(name, ref)` pairs, which is what pickle would
+# otherwise store for a worksheet's tables when `load_test_workbook()` takes
+# a snapshot of a workbook
+copyreg.pickle(TableList, lambda tables: (TableList, (dict(tables),),))
+
+@pytest.fixture
+def workbook():
+    # The source workbook is parsed once per session, but each test gets its
+    # own copy: matching by value or offset creates cells in the worksheet
+    return load_test_workbook()
+
+@pytest.fixture
+def read_only_workbook():
+    # Read-only worksheets do not load named tables, so tests that look
+    # up tables need `workbook` instead
+    wb = load_test_workbook(read_only=True)
+    yield wb
+    wb.close()
+
+@pytest.fixture(params=["editable", "read_only"])
+def any_workbook(request):
+    # Extraction loads editable workbooks, but matching supports read-only
+    # ones too, so tests that work with either run against both
+    return request.getfixturevalue("workbook" if request.param == "editable" else "read_only_workbook")
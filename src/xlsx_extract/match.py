@@ -1,17 +1,20 @@
 import re
 
 from enum import Enum
-from typing import Any, Union, Tuple, Generator
+from operator import eq, ne, gt, ge, lt, le
+from functools import lru_cache
+from typing import Any, Callable, Dict, Sequence, Union, Tuple
 from datetime import datetime, date, time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.cell import Cell
+from openpyxl.chartsheet import Chartsheet
 
 from .range import Range
 
-from .utils import get_range
+from .utils import get_range, get_cell, offset_cell
 
 class Operator(Enum):
 
@@ -27,18 +30,229 @@ class Operator(Enum):
 
     REGEX = "regex"
 
+    # Members are singletons compared by identity, so they can be hashed by
+    # identity too. `Enum` hashes the member name in Python code, which adds
+    # up when operators are used in cache keys.
+    __hash__ = object.__hash__
 
-@dataclass
+
+# Cell values that count as empty. Membership is tested against the set, which
+# takes one hash lookup rather than comparing with each value in turn.
+EMPTY_VALUES = (None, "",)
+EMPTY_VALUE_SET = frozenset(EMPTY_VALUES)
+
+def match_empty(comparator : "Comparator", data : Any) -> Any:
+    return "" if data in EMPTY_VALUE_SET else None
+
+def match_not_empty(comparator : "Comparator", data : Any) -> Any:
+    return data if data not in EMPTY_VALUE_SET else None
+
+# Most regex results to remember per comparator
+REGEX_RESULTS_MAX_SIZE = 4096
+
+def match_regex(comparator : "Comparator", data : Any) -> Any:
+    if not isinstance(data, (str, bytes)):
+        return None
+
+    # Sheets repeat the same labels a lot, so remember what each one gave
+    results = comparator.results
+    if data in results:
+        return results[data]
+
+    result = None
+    match = comparator.pattern.search(data)
+    if match is not None:
+        groups = match.groups()
+        result = groups[0] if len(groups) > 0 else data
+
+    if len(results) >= REGEX_RESULTS_MAX_SIZE:
+        results.clear()
+    results[data] = result
+
+    return result
+
+def match_comparison(compare : Callable[[Any, Any], bool]) -> Callable[["Comparator", Any], Any]:
+    """Build a matcher that returns `data` if `compare(data, value)` holds.
+    Values of incompatible types never match.
+    """
+
+    def matcher(comparator : "Comparator", data : Any) -> Any:
+        value = comparator.value
+        datetime_value = comparator.datetime_value
+
+        # Only date values need widening, so skip the type check otherwise
+        if datetime_value is not value and isinstance(data, datetime):
+            value = datetime_value
+
+        try:
+            return data if compare(data, value) else None
+        except TypeError:
+            return None
+
+    return matcher
+
+def match_nothing(comparator : "Comparator", data : Any) -> Any:
+    return None
+
+def search_each(comparator : "Comparator", data : Sequence[Any]) -> Tuple[int, Any]:
+    matcher = comparator.matcher
+    for idx, item in enumerate(data):
+        match = matcher(comparator, item)
+        if match is not None:
+            return (idx, match)
+    return (None, None)
+
+def search_comparison(compare : Callable[[Any, Any], bool]) -> Callable[["Comparator", Sequence[Any]], Tuple[int, Any]]:
+    """Build a searcher that finds the first item in `data` for which
+    `compare(item, value)` holds, with the same rules as `match_comparison()`.
+    """
+
+    def searcher(comparator : "Comparator", data : Sequence[Any]) -> Tuple[int, Any]:
+        value = comparator.value
+        datetime_value = comparator.datetime_value
+
+        for idx, item in enumerate(data):
+            if item is None:
+                continue
+
+            try:
+                if compare(item, datetime_value if datetime_value is not value and isinstance(item, datetime) else value):
+                    return (idx, item)
+            except TypeError:
+                continue
+
+        return (None, None)
+
+    return searcher
+
+search_equal_each = search_comparison(eq)
+
+def search_equal(comparator : "Comparator", data : Sequence[Any]) -> Tuple[int, Any]:
+    value = comparator.value
+
+    # A date also equals datetimes at midnight, which `index()` would miss
+    if comparator.datetime_value is not value:
+        return search_equal_each(comparator, data)
+
+    # Nothing matches `None`
+    if value is None:
+        return (None, None)
+
+    try:
+        idx = data.index(value)
+    except ValueError:
+        return (None, None)
+
+    return (idx, data[idx])
+
+def search_empty(comparator : "Comparator", data : Sequence[Any]) -> Tuple[int, Any]:
+    found = None
+    for empty in EMPTY_VALUES:
+        try:
+            idx = data.index(empty)
+        except ValueError:
+            continue
+        if found is None or idx < found:
+            found = idx
+
+    return (found, "" if found is not None else None)
+
+def search_not_empty(comparator : "Comparator", data : Sequence[Any]) -> Tuple[int, Any]:
+    for idx, item in enumerate(data):
+        if item not in EMPTY_VALUE_SET:
+            return (idx, item)
+    return (None, None)
+
+def search_regex(comparator : "Comparator", data : Sequence[Any]) -> Tuple[int, Any]:
+    for idx, item in enumerate(data):
+        if not isinstance(item, (str, bytes)):
+            continue
+
+        match = match_regex(comparator, item)
+        if match is not None:
+            return (idx, match)
+
+    return (None, None)
+
+# Matcher function for each operator, looked up once per comparator
+Matchers = {
+    Operator.EQUAL: match_comparison(eq),
+    Operator.NOT_EQUAL: match_comparison(ne),
+    Operator.GREATER: match_comparison(gt),
+    Operator.GREATER_EQUAL: match_comparison(ge),
+    Operator.LESS: match_comparison(lt),
+    Operator.LESS_EQUAL: match_comparison(le),
+    Operator.EMPTY: match_empty,
+    Operator.NOT_EMPTY: match_not_empty,
+    Operator.REGEX: match_regex,
+}
+
+# Functions to search a whole row of values, where an operator can do better
+# than calling its matcher for each item in turn
+Searchers = {
+    Operator.EQUAL: search_equal,
+    Operator.NOT_EQUAL: search_comparison(ne),
+    Operator.GREATER: search_comparison(gt),
+    Operator.GREATER_EQUAL: search_comparison(ge),
+    Operator.LESS: search_comparison(lt),
+    Operator.LESS_EQUAL: search_comparison(le),
+    Operator.EMPTY: search_empty,
+    Operator.NOT_EMPTY: search_not_empty,
+    Operator.REGEX: search_regex,
+}
+
+@dataclass(frozen=True)
 class Comparator:
-    """Parameters to find a single cell
+    """Parameters to find a single cell. Comparators are immutable, so they
+    can be shared between matches (see `get_comparator()`).
     """
 
     operator : Operator
     value : Union[str, int, float, bool, date, time, datetime] = None
 
+    # Compiled version of `value` if `operator` is `REGEX`
+    pattern : re.Pattern = field(default=None, init=False, repr=False, compare=False)
+
+    # Results of `REGEX` matches by matched string
+    results : Dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Version of `value` to compare datetimes with: a date is taken to mean
+    # midnight on that day
+    datetime_value : Any = field(default=None, init=False, repr=False, compare=False)
+
+    # Function implementing `operator`, resolved once so that `match()` does
+    # not need to branch on the operator for every cell
+    matcher : Callable[["Comparator", Any], Any] = field(default=None, init=False, repr=False, compare=False)
+
+    # Function finding the first match in a sequence of values
+    searcher : Callable[["Comparator", Sequence[Any]], Tuple[int, Any]] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        if self.operator == Operator.REGEX:
+        # Derived fields are set through `object` as the dataclass is frozen
+        if self.operator is Operator.REGEX:
             assert type(self.value) is str, "Regular expression must be a string"
+            object.__setattr__(self, 'pattern', re.compile(self.value, re.IGNORECASE))
+
+        # note: datetime derives from date
+        if isinstance(self.value, date) and not isinstance(self.value, datetime):
+            object.__setattr__(self, 'datetime_value', datetime.fromordinal(self.value.toordinal()))
+        else:
+            object.__setattr__(self, 'datetime_value', self.value)
+
+        object.__setattr__(self, 'matcher', Matchers.get(self.operator, match_nothing))
+        object.__setattr__(self, 'searcher', Searchers.get(self.operator, search_each))
+
+    def __reduce__(self):
+        # The derived fields may hold closures, which cannot be pickled, so
+        # pickle only the parameters and derive the rest again
+        return (self.__class__, (self.operator, self.value,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Immutable, so copies of a match can share it
+        return self
 
     def match(self, data : Union[str, int, float, bool, date, time, datetime]) -> Union[str, int, float, bool, date, time, datetime]:
         """Use the `operator` to compare `data` with `value`.
@@ -47,65 +261,29 @@ class Comparator:
         For regex matches with match groups, the content of the first
         match group is returned (as a string).
         """
+        return self.matcher(self, data)
 
-        value = self.value
-        
-        # note: datetime derives from date
-        if isinstance(value, date) and not isinstance(value, datetime) and isinstance(data, datetime):
-            value = datetime.fromordinal(value.toordinal())
-
-        if self.operator == Operator.EMPTY:
-            return "" if (
-                (isinstance(data, str) and len(data) == 0) or
-                (data is None)
-            ) else None
-        elif self.operator == Operator.NOT_EMPTY:
-            return data if (
-                (isinstance(data, str) and len(data) > 0) or
-                (not isinstance(data, str) and data is not None)
-            ) else None
-        elif self.operator == Operator.EQUAL:
-            try:
-                return data if data == value else None
-            except TypeError:
-                return None
-        elif self.operator == Operator.NOT_EQUAL:
-            try:
-                return data if data != value else None
-            except TypeError:
-                return None
-        elif self.operator == Operator.GREATER:
-            try:
-                return data if data > value else None
-            except TypeError:
-                return None
-        elif self.operator == Operator.GREATER_EQUAL:
-            try:
-                return data if data >= value else None
-            except TypeError:
-                return None
-        elif self.operator == Operator.LESS:
-            try:
-                return data if data < value else None
-            except TypeError:
-                return None
-        elif self.operator == Operator.LESS_EQUAL:
-            try:
-                return data if data <= value else None
-            except TypeError:
-                return None
-        elif self.operator == Operator.REGEX:
-            if not isinstance(data, (str, bytes)):
-                return None
-            
-            match = re.search(value, data, re.IGNORECASE)
-            if match is None:
-                return None
-            
-            groups = match.groups()
-            return groups[0] if len(groups) > 0 else data
-        
-        return None  # no match
+    def search(self, data : Sequence[Any]) -> Tuple[int, Any]:
+        """Find the first item in `data` that matches.
+
+        Return value is a tuple of `(index, match)`, or `(None, None)` if
+        nothing matched.
+        """
+        return self.searcher(self, data)
+
+@lru_cache(maxsize=512, typed=True)
+def get_cached_comparator(operator : Operator, value : Any = None) -> Comparator:
+    return Comparator(operator, value)
+
+def get_comparator(operator : Operator, value : Any = None) -> Comparator:
+    """Get a (possibly shared) comparator for `operator` and `value`. Comparators
+    are not modified once built, so identical ones are reused rather than
+    rebuilt. Falls back to a new instance if `value` cannot be hashed.
+    """
+    try:
+        return get_cached_comparator(operator, value)
+    except TypeError:
+        return Comparator(operator, value)
 
 @dataclass
 class Match:
@@ -129,6 +307,14 @@ class Match:
         """Return the worksheet matching `self.sheet`, returning
         a tuple of the worksheet object and the matched title
         """
+        # Sheet titles are unique, so an exact title can be looked up directly
+        if self.sheet.operator is Operator.EQUAL and isinstance(self.sheet.value, str):
+            if self.sheet.value in workbook.sheetnames:
+                ws = workbook[self.sheet.value]
+                if not isinstance(ws, Chartsheet):
+                    return (ws, self.sheet.value)
+            return (None, None)
+
         for ws in workbook.worksheets:
             match = self.sheet.match(ws.title)
             if match is not None:
@@ -167,13 +353,11 @@ class CellMatch(Match):
         assert self.reference is not None or self.value is not None, \
             "%s: Either cell reference or cell value must be given to identify a cell" % self.name
 
-        if self.reference is not None:
-            assert self.value is None, "%s: Cell value cannot be specified if cell reference is given" % self.name
-        
-        if self.value is not None:
-            # can be set in post-init by range match
-            # assert self.sheet is not None, "%s: Sheet is required if matching by value" % self.name
-            assert self.reference is None, "%s: Cell value cannot be specified if cell value is given" % self.name
+        assert self.reference is None or self.value is None, \
+            "%s: Cell value cannot be specified if cell reference is given" % self.name
+
+        # The sheet is not required when matching by value, because it can be
+        # set in post-init by a range match
 
     def match(self, workbook : Workbook) -> Tuple[Range, Any]:
         """Match a single cell
@@ -192,12 +376,18 @@ class CellMatch(Match):
                 cell = range.cell
         elif self.value is not None:
             cell, match = self.find_by_value(worksheet)
-        
+
+        return self.make_result(cell, match)
+
+    def make_result(self, cell : Cell, match : Any) -> Tuple[Range, Any]:
+        """Apply the offsets to a found cell and return a tuple of
+        `(matched cells, matched value)`.
+        """
         if cell is None:
             return (None, None)
 
         if self.row_offset != 0 or self.col_offset != 0:
-            cell = cell.offset(self.row_offset, self.col_offset)
+            cell = offset_cell(cell, self.row_offset, self.col_offset)
         
         if match is None:
             match = cell.value
@@ -214,24 +404,76 @@ class CellMatch(Match):
         if self.value is None or worksheet is None:
             return (None, None)
 
-        for row in self._iter_rows(worksheet):
-            for cell in row:
-                match_value = self.value.match(cell.value)
-                if match_value is not None:
-                    return (cell, match_value)
-        
-        return (None, None)
-    
-    def _iter_rows(self, worksheet : Worksheet) -> Generator[Tuple[Cell], None, None]:
-        """Iterate over rows (list of cells) in the worksheet within the 
-        min/max row/col boundaries.
+        position, match_value = self.find_position_by_value(worksheet)
+
+        if position is None:
+            return (None, None)
+
+        return (get_cell(worksheet, *position), match_value)
+
+    def find_position_by_value(self, worksheet : Worksheet) -> Tuple[Tuple[int, int], Any]:
+        """Search the worksheet for a cell by value comparator, returning
+        a tuple of `((row, column), match)` or `(None, None)`.
         """
-        return worksheet.iter_rows(
-            min_row=self.min_row,
-            max_row=self.max_row,
-            min_col=self.min_col,
-            max_col=self.max_col
-        )
+        min_row = self.min_row or 1
+        min_col = self.min_col or 1
+        max_row = self.max_row
+        max_col = self.max_col
+
+        # Cells outside the used area of the sheet are always empty, so we only
+        # scan that area. If the comparator matches empty cells, the first one
+        # outside the used area is worked out from the sheet dimensions instead.
+        # If the dimensions are not known (read-only sheets may not record them)
+        # we scan the whole search area.
+        # The dimensions of editable worksheets are calculated from all their
+        # cells each time they are asked for, so we only ask once.
+        empty_match = self.value.match(None)
+        scan_max_row = max_row
+        scan_max_col = max_col
+        sheet_max_row = worksheet.max_row
+        sheet_max_col = worksheet.max_column
+
+        if sheet_max_row is not None and sheet_max_col is not None:
+            max_row = max_row if max_row is not None else sheet_max_row
+            max_col = max_col if max_col is not None else sheet_max_col
+            scan_max_row = min(max_row, sheet_max_row)
+            scan_max_col = min(max_col, sheet_max_col)
+
+            if min_row > max_row or min_col > max_col:
+                return (None, None)
+
+            if min_row > scan_max_row or min_col > scan_max_col:
+                if empty_match is not None:
+                    return ((min_row, min_col,), empty_match)
+                return (None, None)
+
+        # Scan bare values a row at a time and only look up the cell object
+        # on a match. The comparator picked its searcher when it was built, so
+        # call that directly.
+        comparator = self.value
+        searcher = comparator.searcher
+        empty_beyond_col = empty_match is not None and max_col is not None and max_col > scan_max_col
+
+        for row_idx, row in enumerate(worksheet.iter_rows(
+            min_row=min_row,
+            max_row=scan_max_row,
+            min_col=min_col,
+            max_col=scan_max_col,
+            values_only=True
+        ), start=min_row):
+            col_idx, match_value = searcher(comparator, row)
+            if col_idx is not None:
+                return ((row_idx, min_col + col_idx,), match_value)
+
+            # The search area continues to the right of the used area
+            if empty_beyond_col:
+                return ((row_idx, scan_max_col + 1,), empty_match)
+
+        # The search area continues below the used area
+        if empty_match is not None and max_row is not None and max_row > scan_max_row:
+            return ((scan_max_row + 1, min_col,), empty_match)
+
+        return (None, None)
 
 @dataclass
 class RangeMatch(Match):
@@ -258,8 +500,6 @@ class RangeMatch(Match):
             assert self.cols is None, "%s: Column count cannot be specified if a reference is used" % self.name
         
         if self.start_cell is not None:
-            assert self.reference is None, "%s: A cell reference cannot be specified if a start cell is given" % self.name
-            
             if self.sheet is not None:
                 self.start_cell.sheet = self.sheet
 
@@ -274,9 +514,6 @@ class RangeMatch(Match):
             if self.cols is not None:
                 assert self.rows is not None, "%s: If a fixed column count is given, a fixed row count must also be specified" % self.name
 
-            if self.rows is not None and self.cols is not None:
-                assert self.end_cell is None, "%s: An end cell cannot be specified if fixed row and column counts are given" % self.name
-
     def match(self, workbook : Workbook) -> Tuple[Range, Any]:
         """Match a range of cells
         """
@@ -317,10 +554,17 @@ class RangeMatch(Match):
         ):
             return (None, None,)
         
-        cells = start_cell_range.sheet["%s:%s" % (start_cell_range.cell.coordinate, end_cell_range.cell.coordinate,)]
+        start_cell = start_cell_range.cell
+        end_cell = end_cell_range.cell
 
         return (
-            Range(cells),
+            Range.from_bounds(
+                start_cell_range.sheet,
+                min_row=start_cell.row,
+                min_col=start_cell.column,
+                max_row=end_cell.row,
+                max_col=end_cell.column
+            ),
             start_cell_match,
         )
     
@@ -336,13 +580,12 @@ class RangeMatch(Match):
             return (None, None,)
         
         return (
-            Range(
-                tuple(start_cell_range.sheet.iter_rows(
-                    min_row=start_cell_range.cell.row,
-                    min_col=start_cell_range.cell.column,
-                    max_row=start_cell_range.cell.row + (self.rows - 1),
-                    max_col=start_cell_range.cell.column + (self.cols - 1)
-                )),
+            Range.from_bounds(
+                start_cell_range.sheet,
+                min_row=start_cell_range.cell.row,
+                min_col=start_cell_range.cell.column,
+                max_row=start_cell_range.cell.row + (self.rows - 1),
+                max_col=start_cell_range.cell.column + (self.cols - 1)
             ),
             start_cell_match,
         )
@@ -365,26 +608,24 @@ class RangeMatch(Match):
 
         # find first blank column along first row
         # we use `iter_rows()` because `iter_cols()` isn't available in readonly mode!
+        empty = get_comparator(Operator.EMPTY)
         for r in sheet.iter_rows(min_row=start_cell.row, max_row=start_cell.row, min_col=start_cell.column + 1, values_only=True):
-            for c in r:
-                if c is None or c == "":
-                    break
-                cols += 1
+            blank, _ = empty.search(r)
+            cols += len(r) if blank is None else blank
         
         # find first blank row along first column
         for r in sheet.iter_rows(min_row=start_cell.row + 1, min_col=start_cell.column, max_col=start_cell.column, values_only=True):
-            if len(r) == 0 or r[0] is None or r[0] == "":
+            if len(r) == 0 or r[0] in EMPTY_VALUE_SET:
                 break
             rows += 1
 
         return (
-            Range(
-                tuple(sheet.iter_rows(
-                    min_row=start_cell.row,
-                    min_col=start_cell.column,
-                    max_row=start_cell.row + (rows - 1),
-                    max_col=start_cell.column + (cols - 1)
-                ))
+            Range.from_bounds(
+                sheet,
+                min_row=start_cell.row,
+                min_col=start_cell.column,
+                max_row=start_cell.row + (rows - 1),
+                max_col=start_cell.column + (cols - 1)
             ),
             start_cell_match
         )
@@ -1,21 +1,28 @@
-import os.path
+import re
+import copy
+import pickle
+import dataclasses
 import datetime
 import pytest
-import openpyxl
 
 from . import match
-
-def get_test_workbook():
-    filename = os.path.join(os.path.dirname(__file__), 'test_data', 'source.xlsx')
-    return openpyxl.load_workbook(filename, data_only=True)
-
-def test_construct_cell_match():
-
-    sheet = match.Comparator(operator=match.Operator.EQUAL, value="a")
-
-    match.CellMatch(
+from .match import Operator
+from .testing import requires_assertions
+
+# Comparators are immutable, so tests share them through `get_comparator()`
+# rather than building each one again. Matches are not shared: range matches
+# copy their sheet onto their cell matches.
+SHEET = match.get_comparator(Operator.EQUAL, "a")
+NOT_EMPTY = match.get_comparator(Operator.NOT_EMPTY)
+
+# Valid constructor arguments for each kind of match, with the overrides
+# that make them invalid, as `(id, class, kwargs, {id: overrides})`. The
+# arguments are built by a function for each test, because range matches
+# change the cell matches they are given.
+CONSTRUCT_CASES = [
+    ("cell_by_reference", match.CellMatch, lambda: dict(
         name="A",
-        sheet=sheet,
+        sheet=SHEET,
         min_row=1,
         max_row=5,
         min_col=1,
@@ -23,293 +30,449 @@ def test_construct_cell_match():
         reference="A3",
         row_offset=1,
         col_offset=-1
-    )
-
-    match.CellMatch(
+    ), {
+        "no_criteria": lambda: dict(reference=None),
+        "reference_and_value": lambda: dict(value=NOT_EMPTY),
+    }),
+    ("cell_by_value", match.CellMatch, lambda: dict(
         name="A",
-        sheet=sheet,
-        value=match.Comparator(operator=match.Operator.NOT_EMPTY),
-    )
-
-    # No match criteria
-    with pytest.raises(AssertionError):
-        match.CellMatch(
-            name="F",
-            sheet=sheet,
-        )
-    
-    # Too many match criteria (reference + value)
-    with pytest.raises(AssertionError):
-        match.CellMatch(
-            name="F",
-            sheet=sheet,
-            reference="A3",
-            value=match.Comparator(operator=match.Operator.NOT_EMPTY),
-        )
-    
-def test_construct_range_match():
-
-    sheet = match.Comparator(operator=match.Operator.EQUAL, value="a")
-
-    match.RangeMatch(
+        sheet=SHEET,
+        value=NOT_EMPTY,
+    ), {
+        "no_criteria": lambda: dict(value=None),
+    }),
+    ("range_by_reference", match.RangeMatch, lambda: dict(
         name="A",
-        sheet=sheet,
+        sheet=SHEET,
         reference="Table1",
-    )
+    ), {
+        "no_reference_or_start_cell": lambda: dict(reference=None),
+        "reference_and_start_cell": lambda: dict(start_cell=match.CellMatch(name="C", sheet=SHEET, reference="ACell")),
+    }),
+    ("range_by_dimensions", match.RangeMatch, lambda: dict(
+        name="A",
+        start_cell=match.CellMatch(name="C", sheet=SHEET, reference="ACell"),
+        rows=10,
+        cols=5,
+    ), {
+        "end_cell_and_dimensions": lambda: dict(end_cell=match.CellMatch(name="D", sheet=SHEET, reference="B:12")),
+        "cols_without_rows": lambda: dict(rows=None),
+        "rows_without_cols": lambda: dict(cols=None),
+    }),
+    ("range_by_end_cell", match.RangeMatch, lambda: dict(
+        name="A",
+        sheet=SHEET,
+        start_cell=match.CellMatch(name="C", reference="ACell"),
+        end_cell=match.CellMatch(name="D", reference="B:12"),
+    ), {}),
+]
+
+@pytest.mark.parametrize("cls,kwargs", [
+    pytest.param(cls, kwargs, id=case_id) for case_id, cls, kwargs, _ in CONSTRUCT_CASES
+])
+def test_construct_valid(cls, kwargs):
+    assert cls(**kwargs()) is not None
+
+@requires_assertions
+@pytest.mark.parametrize("cls,kwargs,override", [
+    pytest.param(cls, kwargs, override, id="%s-%s" % (case_id, override_id))
+    for case_id, cls, kwargs, overrides in CONSTRUCT_CASES
+    for override_id, override in overrides.items()
+])
+def test_construct_invalid(cls, kwargs, override):
+    with pytest.raises(AssertionError):
+        cls(**{**kwargs(), **override()})
 
+def test_construct_range_match_copies_sheet():
     r = match.RangeMatch(
         name="A",
-        sheet=sheet,
+        sheet=SHEET,
         start_cell=match.CellMatch(name="C", reference="ACell")
     )
-    assert r.sheet is sheet
-    assert r.start_cell.sheet is sheet
+    assert r.sheet is SHEET
+    assert r.start_cell.sheet is SHEET
 
     r = match.RangeMatch(
         name="A",
-        start_cell=match.CellMatch(name="C", sheet=sheet, reference="ACell"),
+        start_cell=match.CellMatch(name="C", sheet=SHEET, reference="ACell"),
         rows=10,
         cols=5,
     )
     assert r.sheet is None
-    assert r.start_cell.sheet is sheet
+    assert r.start_cell.sheet is SHEET
 
     r = match.RangeMatch(
         name="A",
-        sheet=sheet,
+        sheet=SHEET,
         start_cell=match.CellMatch(name="C", reference="ACell"),
         end_cell=match.CellMatch(name="D", reference="B:12"),
     )
-    assert r.sheet is sheet
-    assert r.start_cell.sheet is sheet
-    assert r.end_cell.sheet is sheet
-
-    # Need start cell or reference
-    with pytest.raises(AssertionError):
-        match.RangeMatch(
-            name="A",
-            sheet=sheet,
-        )
-    
-    # ... but not both
-    with pytest.raises(AssertionError):
-        match.RangeMatch(
-            name="A",
-            sheet=sheet,
-            reference="Table2",
-            start_cell=match.CellMatch(name="C", sheet=sheet, reference="ACell"),
-        )
-    
-    # Cannot have both end cell and fixed size
-    with pytest.raises(AssertionError):
-        match.RangeMatch(
-            name="A",
-            sheet=sheet,
-            start_cell=match.CellMatch(name="C", sheet=sheet, reference="ACell"),
-            end_cell=match.CellMatch(name="D", sheet=sheet, reference="B:12"),
-            rows=5,
-            cols=5
-        )
-    
-    # Must have both rows and cols
-    with pytest.raises(AssertionError):
-        match.RangeMatch(
-            name="A",
-            sheet=sheet,
-            start_cell=match.CellMatch(name="C", sheet=sheet, reference="ACell"),
-            # rows=5,
-            cols=5
-        )
-    
-    # Must have both rows and cols
-    with pytest.raises(AssertionError):
-        match.RangeMatch(
-            name="A",
-            sheet=sheet,
-            start_cell=match.CellMatch(name="C", sheet=sheet, reference="ACell"),
-            rows=5,
-            # cols=5
-        )
+    assert r.sheet is SHEET
+    assert r.start_cell.sheet is SHEET
+    assert r.end_cell.sheet is SHEET
+
+MATCH_VALUE_EMPTY = [
+    ("", None, ""),
+    (None, None, ""),  # yes, indeed
+
+    ("a", None, None),
+    (1, None, None),
+    (0, None, None),
+    (False, None, None),
+    (" ", None, None),
+]
+
+MATCH_VALUE_NOT_EMPTY = [
+    ("", None, None),
+    (None, None, None),
+
+    ("a", None, "a"),
+    (1, None, 1),
+    (0, None, 0),
+    (False, None, False),
+    (" ", None, " "),
+]
+
+MATCH_VALUE_EQUAL = [
+    ("foo", "foo", "foo"),
+    (1, 1, 1),
+    (1.2, 1.2, 1.2),
+    (True, True, True),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 2), datetime.date(2020, 1, 2)),
+    (datetime.datetime(2020, 1, 2), datetime.date(2020, 1, 2), datetime.datetime(2020, 1, 2)),
+    (datetime.time(14, 0), datetime.time(14, 0), datetime.time(14, 0)),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 0)),
+
+    ("bar", "foo", None),
+    (2, 1, None),
+    (2.2, 1.2, None),
+    (False, True, None),
+    (datetime.date(2020, 1, 3), datetime.date(2020, 1, 2), None),
+    (datetime.time(14, 1), datetime.time(14, 0), None),
+    (datetime.datetime(2020, 1, 2, 14, 1), datetime.datetime(2020, 1, 2, 14, 0), None),
+]
+
+MATCH_VALUE_NOT_EQUAL = [
+    ("bar", "foo", "bar"),
+    (2, 1, 2),
+    (2.2, 1.2, 2.2),
+    (False, True, False),
+    (datetime.date(2020, 1, 3), datetime.date(2020, 1, 2), datetime.date(2020, 1, 3)),
+    (datetime.time(14, 1), datetime.time(14, 0), datetime.time(14, 1)),
+    (datetime.datetime(2020, 1, 2, 14, 1), datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 1)),
+
+    ("foo", "foo", None),
+    (1, 1, None),
+    (1.2, 1.2, None),
+    (True, True, None),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 2), None),
+    (datetime.time(14, 0), datetime.time(14, 0), None),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 0), None),
+]
+
+MATCH_VALUE_GREATER_THAN = [
+    ("foo", "boo", "foo"),
+    (2, 1, 2),
+    (1.2, 1.1, 1.2),
+    # (True, True, True),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)),
+    (datetime.time(14, 0), datetime.time(13, 0), datetime.time(14, 0)),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 13, 0), datetime.datetime(2020, 1, 2, 14, 0)),
+
+    ("foo", "foo", None),
+    (1, 1, None),
+    (1.2, 1.2, None),
+    (True, True, None),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 2), None),
+    (datetime.time(14, 0), datetime.time(14, 0), None),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 0), None),
+
+    ("foo", "goo", None),
+    (1, 2, None),
+    (1.2, 1.3, None),
+    # (True, True, None),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 3), None),
+    (datetime.time(14, 0), datetime.time(14, 1), None),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 1), None),
+]
+
+MATCH_VALUE_GREATER_THAN_EQUAL = [
+    ("foo", "boo", "foo"),
+    (2, 1, 2),
+    (1.2, 1.1, 1.2),
+    # (True, True, True),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)),
+    (datetime.time(14, 0), datetime.time(13, 0), datetime.time(14, 0)),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 13, 0), datetime.datetime(2020, 1, 2, 14, 0)),
+
+    ("foo", "foo", "foo"),
+    (1, 1, 1),
+    (1.2, 1.2, 1.2),
+    (True, True, True),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 2), datetime.date(2020, 1, 2)),
+    (datetime.time(14, 0), datetime.time(14, 0), datetime.time(14, 0)),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 0)),
+
+    ("foo", "goo", None),
+    (1, 2, None),
+    (1.2, 1.3, None),
+    # (True, True, None),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 3), None),
+    (datetime.time(14, 0), datetime.time(14, 1), None),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 1), None),
+]
+
+MATCH_VALUE_LESS_THAN = [
+    ("foo", "goo", "foo"),
+    (2, 3, 2),
+    (1.2, 1.3, 1.2),
+    # (True, True, True),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 3), datetime.date(2020, 1, 2)),
+    (datetime.time(14, 0), datetime.time(15, 0), datetime.time(14, 0)),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 15, 0), datetime.datetime(2020, 1, 2, 14, 0)),
+
+    ("foo", "foo", None),
+    (1, 1, None),
+    (1.2, 1.2, None),
+    (True, True, None),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 2), None),
+    (datetime.time(14, 0), datetime.time(14, 0), None),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 0), None),
+
+    ("foo", "boo", None),
+    (2, 1, None),
+    (1.2, 1.1, None),
+    # (True, True, None),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 1), None),
+    (datetime.time(14, 0), datetime.time(13, 0), None),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 13, 0), None),
+]
+
+MATCH_VALUE_LESS_THAN_EQUAL = [
+    ("foo", "goo", "foo"),
+    (2, 3, 2),
+    (1.2, 1.3, 1.2),
+    # (True, True, True),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 3), datetime.date(2020, 1, 2)),
+    (datetime.time(14, 0), datetime.time(15, 0), datetime.time(14, 0)),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 15, 0), datetime.datetime(2020, 1, 2, 14, 0)),
+
+    ("foo", "foo", "foo"),
+    (1, 1, 1),
+    (1.2, 1.2, 1.2),
+    (True, True, True),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 2), datetime.date(2020, 1, 2)),
+    (datetime.time(14, 0), datetime.time(14, 0), datetime.time(14, 0)),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 14, 0)),
+
+    ("foo", "boo", None),
+    (2, 1, None),
+    (1.2, 1.1, None),
+    # (True, True, None),
+    (datetime.date(2020, 1, 2), datetime.date(2020, 1, 1), None),
+    (datetime.time(14, 0), datetime.time(13, 0), None),
+    (datetime.datetime(2020, 1, 2, 14, 0), datetime.datetime(2020, 1, 2, 13, 0), None),
+]
+
+MATCH_VALUE_REGEX = [
+    ("foo bar", "foo", "foo bar"),
+    ("Date", "^Da(.+)", "te"),
+    ("date", "^DA", "date"),
+
+    ("bar", "foo", None),
+    ("", "^$", ""),
+    (1, "1", None),
+    (datetime.date(2020, 1, 2), "2020", None),
+    (None, ".*", None),
+]
+
+def mv(data, operator, value):
+    return match.get_comparator(operator, value).match(data)
 
 class TestMatchValue:
 
-    def mv(self, data, operator, value):
-        return match.Comparator(operator=operator, value=value).match(data)
-
+    @requires_assertions
     def test_match_value_requires_regex_to_be_string(self):
+        # Checked when the pattern is compiled, before any value is matched
         with pytest.raises(AssertionError):
-            self.mv(data="foo", operator=match.Operator.REGEX, value=1)
+            match.Comparator(Operator.REGEX, 1)
+
+        with pytest.raises(AssertionError):
+            match.get_comparator(Operator.REGEX, 1)
+
+        with pytest.raises(AssertionError):
+            mv("foo", Operator.REGEX, 1)
 
     def test_match_value_requires_consistent_types(self):
-        assert self.mv(data="1", operator=match.Operator.EQUAL, value=1) == None
-
-    def test_match_value_empty(self):
-        assert self.mv(data="", operator=match.Operator.EMPTY, value=None) == ""
-        assert self.mv(data=None, operator=match.Operator.EMPTY, value=None) == ""  # yes, indeed
-
-        assert self.mv(data="a", operator=match.Operator.EMPTY, value=None) == None
-        assert self.mv(data=1, operator=match.Operator.EMPTY, value=None) == None
-
-    def test_match_value_not_empty(self):
-        assert self.mv(data="", operator=match.Operator.NOT_EMPTY, value=None) == None
-        assert self.mv(data=None, operator=match.Operator.NOT_EMPTY, value=None) == None
-
-        assert self.mv(data="a", operator=match.Operator.NOT_EMPTY, value=None) == "a"
-        assert self.mv(data=1, operator=match.Operator.NOT_EMPTY, value=None) == 1
-
-    def test_match_value_equal(self):
-        assert self.mv(data="foo", operator=match.Operator.EQUAL, value="foo") == "foo"
-        assert self.mv(data=1, operator=match.Operator.EQUAL, value=1) == 1
-        assert self.mv(data=1.2, operator=match.Operator.EQUAL, value=1.2) == 1.2
-        assert self.mv(data=True, operator=match.Operator.EQUAL, value=True) == True
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.EQUAL, value=datetime.date(2020, 1, 2)) == datetime.date(2020, 1, 2)
-        assert self.mv(data=datetime.datetime(2020, 1, 2), operator=match.Operator.EQUAL, value=datetime.date(2020, 1, 2)) == datetime.datetime(2020, 1, 2)
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.EQUAL, value=datetime.time(14, 0)) == datetime.time(14, 0)
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.EQUAL, value=datetime.datetime(2020, 1, 2, 14, 0)) == datetime.datetime(2020, 1, 2, 14, 0)
-
-        assert self.mv(data="bar", operator=match.Operator.EQUAL, value="foo") == None
-        assert self.mv(data=2, operator=match.Operator.EQUAL, value=1) == None
-        assert self.mv(data=2.2, operator=match.Operator.EQUAL, value=1.2) == None
-        assert self.mv(data=False, operator=match.Operator.EQUAL, value=True) == None
-        assert self.mv(data=datetime.date(2020, 1, 3), operator=match.Operator.EQUAL, value=datetime.date(2020, 1, 2)) == None
-        assert self.mv(data=datetime.time(14, 1), operator=match.Operator.EQUAL, value=datetime.time(14, 0)) == None
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 1), operator=match.Operator.EQUAL, value=datetime.datetime(2020, 1, 2, 14, 0)) == None
-
-    def test_match_value_not_equal(self):
-        assert self.mv(data="bar", operator=match.Operator.NOT_EQUAL, value="foo") == "bar"
-        assert self.mv(data=2, operator=match.Operator.NOT_EQUAL, value=1) == 2
-        assert self.mv(data=2.2, operator=match.Operator.NOT_EQUAL, value=1.2) == 2.2
-        assert self.mv(data=False, operator=match.Operator.NOT_EQUAL, value=True) == False
-        assert self.mv(data=datetime.date(2020, 1, 3), operator=match.Operator.NOT_EQUAL, value=datetime.date(2020, 1, 2)) == datetime.date(2020, 1, 3)
-        assert self.mv(data=datetime.time(14, 1), operator=match.Operator.NOT_EQUAL, value=datetime.time(14, 0)) == datetime.time(14, 1)
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 1), operator=match.Operator.NOT_EQUAL, value=datetime.datetime(2020, 1, 2, 14, 0)) == datetime.datetime(2020, 1, 2, 14, 1)
-        
-        assert self.mv(data="foo", operator=match.Operator.NOT_EQUAL, value="foo") == None
-        assert self.mv(data=1, operator=match.Operator.NOT_EQUAL, value=1) == None
-        assert self.mv(data=1.2, operator=match.Operator.NOT_EQUAL, value=1.2) == None
-        assert self.mv(data=True, operator=match.Operator.NOT_EQUAL, value=True) == None
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.NOT_EQUAL, value=datetime.date(2020, 1, 2)) == None
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.NOT_EQUAL, value=datetime.time(14, 0)) == None
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.NOT_EQUAL, value=datetime.datetime(2020, 1, 2, 14, 0)) == None
-
-    def test_match_value_greater_than(self):
-        assert self.mv(data="foo", operator=match.Operator.GREATER, value="boo") == "foo"
-        assert self.mv(data=2, operator=match.Operator.GREATER, value=1) == 2
-        assert self.mv(data=1.2, operator=match.Operator.GREATER, value=1.1) == 1.2
-        # assert self.mv(data=True, operator=match.Operator.GREATER, value=True) == True
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.GREATER, value=datetime.date(2020, 1, 1)) == datetime.date(2020, 1, 2)
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.GREATER, value=datetime.time(13, 0)) == datetime.time(14, 0)
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.GREATER, value=datetime.datetime(2020, 1, 2, 13, 0)) == datetime.datetime(2020, 1, 2, 14, 0)
-
-        assert self.mv(data="foo", operator=match.Operator.GREATER, value="foo") == None
-        assert self.mv(data=1, operator=match.Operator.GREATER, value=1) == None
-        assert self.mv(data=1.2, operator=match.Operator.GREATER, value=1.2) == None
-        assert self.mv(data=True, operator=match.Operator.GREATER, value=True) == None
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.GREATER, value=datetime.date(2020, 1, 2)) == None
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.GREATER, value=datetime.time(14, 0)) == None
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.GREATER, value=datetime.datetime(2020, 1, 2, 14, 0)) == None
-
-        assert self.mv(data="foo", operator=match.Operator.GREATER, value="goo") == None
-        assert self.mv(data=1, operator=match.Operator.GREATER, value=2) == None
-        assert self.mv(data=1.2, operator=match.Operator.GREATER, value=1.3) == None
-        # assert self.mv(data=True, operator=match.Operator.GREATER, value=True) == None
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.GREATER, value=datetime.date(2020, 1, 3)) == None
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.GREATER, value=datetime.time(14, 1)) == None
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.GREATER, value=datetime.datetime(2020, 1, 2, 14, 1)) == None
-
-    def test_match_value_greater_than_equal(self):
-        assert self.mv(data="foo", operator=match.Operator.GREATER_EQUAL, value="boo") == "foo"
-        assert self.mv(data=2, operator=match.Operator.GREATER_EQUAL, value=1) == 2
-        assert self.mv(data=1.2, operator=match.Operator.GREATER_EQUAL, value=1.1) == 1.2
-        # assert self.mv(data=True, operator=match.Operator.GREATER_EQUAL, value=True) == True
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.GREATER_EQUAL, value=datetime.date(2020, 1, 1)) == datetime.date(2020, 1, 2)
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.GREATER_EQUAL, value=datetime.time(13, 0)) == datetime.time(14, 0)
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.GREATER_EQUAL, value=datetime.datetime(2020, 1, 2, 13, 0)) == datetime.datetime(2020, 1, 2, 14, 0)
-
-        assert self.mv(data="foo", operator=match.Operator.GREATER_EQUAL, value="foo") == "foo"
-        assert self.mv(data=1, operator=match.Operator.GREATER_EQUAL, value=1) == 1
-        assert self.mv(data=1.2, operator=match.Operator.GREATER_EQUAL, value=1.2) == 1.2
-        assert self.mv(data=True, operator=match.Operator.GREATER_EQUAL, value=True) == True
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.GREATER_EQUAL, value=datetime.date(2020, 1, 2)) == datetime.date(2020, 1, 2)
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.GREATER_EQUAL, value=datetime.time(14, 0)) == datetime.time(14, 0)
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.GREATER_EQUAL, value=datetime.datetime(2020, 1, 2, 14, 0)) == datetime.datetime(2020, 1, 2, 14, 0)
-
-        assert self.mv(data="foo", operator=match.Operator.GREATER_EQUAL, value="goo") == None
-        assert self.mv(data=1, operator=match.Operator.GREATER_EQUAL, value=2) == None
-        assert self.mv(data=1.2, operator=match.Operator.GREATER_EQUAL, value=1.3) == None
-        # assert self.mv(data=True, operator=match.Operator.GREATER_EQUAL, value=True) == None
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.GREATER_EQUAL, value=datetime.date(2020, 1, 3)) == None
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.GREATER_EQUAL, value=datetime.time(14, 1)) == None
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.GREATER_EQUAL, value=datetime.datetime(2020, 1, 2, 14, 1)) == None
-
-    def test_match_value_less_than(self):
-        assert self.mv(data="foo", operator=match.Operator.LESS, value="goo") == "foo"
-        assert self.mv(data=2, operator=match.Operator.LESS, value=3) == 2
-        assert self.mv(data=1.2, operator=match.Operator.LESS, value=1.3) == 1.2
-        # assert self.mv(data=True, operator=match.Operator.LESS, value=True) == True
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.LESS, value=datetime.date(2020, 1, 3)) == datetime.date(2020, 1, 2)
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.LESS, value=datetime.time(15, 0)) == datetime.time(14, 0)
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.LESS, value=datetime.datetime(2020, 1, 2, 15, 0)) == datetime.datetime(2020, 1, 2, 14, 0)
-
-        assert self.mv(data="foo", operator=match.Operator.LESS, value="foo") == None
-        assert self.mv(data=1, operator=match.Operator.LESS, value=1) == None
-        assert self.mv(data=1.2, operator=match.Operator.LESS, value=1.2) == None
-        assert self.mv(data=True, operator=match.Operator.LESS, value=True) == None
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.LESS, value=datetime.date(2020, 1, 2)) == None
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.LESS, value=datetime.time(14, 0)) == None
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.LESS, value=datetime.datetime(2020, 1, 2, 14, 0)) == None
-
-        assert self.mv(data="foo", operator=match.Operator.LESS, value="boo") == None
-        assert self.mv(data=2, operator=match.Operator.LESS, value=1) == None
-        assert self.mv(data=1.2, operator=match.Operator.LESS, value=1.1) == None
-        # assert self.mv(data=True, operator=match.Operator.LESS, value=True) == None
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.LESS, value=datetime.date(2020, 1, 1)) == None
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.LESS, value=datetime.time(13, 0)) == None
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.LESS, value=datetime.datetime(2020, 1, 2, 13, 0)) == None
-
-    def test_match_value_less_than_equal(self):
-        assert self.mv(data="foo", operator=match.Operator.LESS, value="goo") == "foo"
-        assert self.mv(data=2, operator=match.Operator.LESS, value=3) == 2
-        assert self.mv(data=1.2, operator=match.Operator.LESS, value=1.3) == 1.2
-        # assert self.mv(data=True, operator=match.Operator.LESS, value=True) == True
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.LESS, value=datetime.date(2020, 1, 3)) == datetime.date(2020, 1, 2)
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.LESS, value=datetime.time(15, 0)) == datetime.time(14, 0)
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.LESS, value=datetime.datetime(2020, 1, 2, 15, 0)) == datetime.datetime(2020, 1, 2, 14, 0)
-
-        assert self.mv(data="foo", operator=match.Operator.LESS_EQUAL, value="foo") == "foo"
-        assert self.mv(data=1, operator=match.Operator.LESS_EQUAL, value=1) == 1
-        assert self.mv(data=1.2, operator=match.Operator.LESS_EQUAL, value=1.2) == 1.2
-        assert self.mv(data=True, operator=match.Operator.LESS_EQUAL, value=True) == True
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.LESS_EQUAL, value=datetime.date(2020, 1, 2)) == datetime.date(2020, 1, 2)
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.LESS_EQUAL, value=datetime.time(14, 0)) == datetime.time(14, 0)
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.LESS_EQUAL, value=datetime.datetime(2020, 1, 2, 14, 0)) == datetime.datetime(2020, 1, 2, 14, 0)
-
-        assert self.mv(data="foo", operator=match.Operator.LESS, value="boo") == None
-        assert self.mv(data=2, operator=match.Operator.LESS, value=1) == None
-        assert self.mv(data=1.2, operator=match.Operator.LESS, value=1.1) == None
-        # assert self.mv(data=True, operator=match.Operator.LESS, value=True) == None
-        assert self.mv(data=datetime.date(2020, 1, 2), operator=match.Operator.LESS, value=datetime.date(2020, 1, 1)) == None
-        assert self.mv(data=datetime.time(14, 0), operator=match.Operator.LESS, value=datetime.time(13, 0)) == None
-        assert self.mv(data=datetime.datetime(2020, 1, 2, 14, 0), operator=match.Operator.LESS, value=datetime.datetime(2020, 1, 2, 13, 0)) == None
-
-    def test_match_value_regex(self):
-        assert self.mv(data="foo bar", operator=match.Operator.REGEX, value="foo") == "foo bar"
+        assert mv("1", Operator.EQUAL, 1) == None
+
+    @pytest.mark.parametrize("data,value,expected", MATCH_VALUE_EMPTY)
+    def test_match_value_empty(self, data, value, expected):
+        assert mv(data, Operator.EMPTY, value) == expected
+
+    @pytest.mark.parametrize("data,value,expected", MATCH_VALUE_NOT_EMPTY)
+    def test_match_value_not_empty(self, data, value, expected):
+        assert mv(data, Operator.NOT_EMPTY, value) == expected
+
+    @pytest.mark.parametrize("data,value,expected", MATCH_VALUE_EQUAL)
+    def test_match_value_equal(self, data, value, expected):
+        assert mv(data, Operator.EQUAL, value) == expected
+
+    @pytest.mark.parametrize("data,value,expected", MATCH_VALUE_NOT_EQUAL)
+    def test_match_value_not_equal(self, data, value, expected):
+        assert mv(data, Operator.NOT_EQUAL, value) == expected
+
+    @pytest.mark.parametrize("data,value,expected", MATCH_VALUE_GREATER_THAN)
+    def test_match_value_greater_than(self, data, value, expected):
+        assert mv(data, Operator.GREATER, value) == expected
+
+    @pytest.mark.parametrize("data,value,expected", MATCH_VALUE_GREATER_THAN_EQUAL)
+    def test_match_value_greater_than_equal(self, data, value, expected):
+        assert mv(data, Operator.GREATER_EQUAL, value) == expected
+
+    @pytest.mark.parametrize("data,value,expected", MATCH_VALUE_LESS_THAN)
+    def test_match_value_less_than(self, data, value, expected):
+        assert mv(data, Operator.LESS, value) == expected
+
+    @pytest.mark.parametrize("data,value,expected", MATCH_VALUE_LESS_THAN_EQUAL)
+    def test_match_value_less_than_equal(self, data, value, expected):
+        assert mv(data, Operator.LESS_EQUAL, value) == expected
+
+    @pytest.mark.parametrize("data,value,expected", MATCH_VALUE_REGEX)
+    def test_match_value_regex(self, data, value, expected):
+        assert mv(data, Operator.REGEX, value) == expected
+
+    def test_match_value_regex_compiled_once(self):
+        c = match.Comparator(operator=Operator.REGEX, value="^Da(.+)")
+        pattern = c.pattern
+
+        assert pattern.flags & re.IGNORECASE
+        assert c.match("Date") == "te"
+        assert c.match("date") == "te"
+        assert c.match("Day") == "y"
+        assert c.match(1) == None
+        assert c.pattern is pattern
+
+        assert match.Comparator(operator=Operator.EQUAL, value="^Da(.+)").pattern is None
+
+    def test_match_value_regex_results_remembered(self, monkeypatch):
+        c = match.Comparator(operator=Operator.REGEX, value="^Da(.+)")
+
+        assert c.match("Date") == "te"
+        assert c.match("Beta") == None
+        assert c.match(1) == None
+        assert c.results == {"Date": "te", "Beta": None}
+
+        c.results["Date"] = "remembered"
+        assert c.match("Date") == "remembered"
+        assert c.search((1, "Date",)) == (1, "remembered",)
+
+        # The results are forgotten when there are too many
+        monkeypatch.setattr(match, 'REGEX_RESULTS_MAX_SIZE', 2)
+        assert c.match("Day") == "y"
+        assert c.results == {"Day": "y"}
+
+    def test_match_value_datetime_value_resolved_once(self):
+        c = match.Comparator(operator=Operator.GREATER, value=datetime.date(2020, 1, 2))
+        assert c.datetime_value == datetime.datetime(2020, 1, 2)
+        assert c.match(datetime.datetime(2020, 1, 2, 1, 0)) == datetime.datetime(2020, 1, 2, 1, 0)
+        assert c.match(datetime.date(2020, 1, 2)) == None
+
+        c = match.Comparator(operator=Operator.GREATER, value=datetime.datetime(2020, 1, 2))
+        assert c.datetime_value is c.value
+
+        c = match.Comparator(operator=Operator.EQUAL, value="foo")
+        assert c.datetime_value is c.value
+
+    @pytest.mark.parametrize("operator,cases", [
+        (Operator.EMPTY, MATCH_VALUE_EMPTY),
+        (Operator.NOT_EMPTY, MATCH_VALUE_NOT_EMPTY),
+        (Operator.EQUAL, MATCH_VALUE_EQUAL),
+        (Operator.NOT_EQUAL, MATCH_VALUE_NOT_EQUAL),
+        (Operator.GREATER, MATCH_VALUE_GREATER_THAN),
+        (Operator.GREATER_EQUAL, MATCH_VALUE_GREATER_THAN_EQUAL),
+        (Operator.LESS, MATCH_VALUE_LESS_THAN),
+        (Operator.LESS_EQUAL, MATCH_VALUE_LESS_THAN_EQUAL),
+        (Operator.REGEX, MATCH_VALUE_REGEX),
+    ])
+    def test_match_value_search(self, operator, cases):
+        for data, value, expected in cases:
+            c = match.get_comparator(operator, value)
+            row = ("x", 0, False, None, datetime.datetime(2020, 1, 1)) + (data,)
+            matches = [(idx, c.match(item)) for idx, item in enumerate(row) if c.match(item) is not None]
+
+            assert c.search(row) == (matches[0] if matches else (None, None))
+            assert c.search(()) == (None, None)
+
+def test_operator_hash():
+    assert len(Operator) == 9
+    assert len({o: o.value for o in Operator}) == len(Operator)
+    assert hash(Operator.EQUAL) == hash(Operator("="))
+    assert {Operator.EQUAL: 1}[Operator("=")] == 1
+    assert pickle.loads(pickle.dumps(Operator.REGEX)) is Operator.REGEX
+
+def test_comparator_frozen():
+    c = match.Comparator(Operator.EQUAL, "Date")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        c.value = "Other"
+
+    assert hash(c) == hash(match.Comparator(Operator.EQUAL, "Date"))
+    assert copy.copy(c) is c
+    assert copy.deepcopy(c) is c
+    assert copy.deepcopy(match.CellMatch(name="test", value=c)).value is c
+
+@pytest.mark.parametrize("operator", list(Operator))
+def test_comparator_pickle(operator):
+    c = match.Comparator(operator, "^Da(.+)")
+    p = pickle.loads(pickle.dumps(c))
+
+    assert p == c
+    assert p.match("Date") == c.match("Date")
+    assert p.search(("x", "Date",)) == c.search(("x", "Date",))
+
+def test_match_pickle():
+    m = match.RangeMatch(
+        name="A",
+        sheet=SHEET,
+        start_cell=match.CellMatch(name="C", value=match.get_comparator(Operator.GREATER, datetime.date(2021, 1, 1))),
+        end_cell=match.CellMatch(name="D", reference="B12"),
+    )
+    p = pickle.loads(pickle.dumps(m))
+
+    assert p == m
+    assert p.start_cell.value.datetime_value == datetime.datetime(2021, 1, 1)
+
+def test_get_comparator():
+    c = match.get_comparator(Operator.EQUAL, "Report 1")
+
+    assert c == match.Comparator(Operator.EQUAL, "Report 1")
+    assert match.get_comparator(Operator.EQUAL, "Report 1") is c
+    assert match.get_comparator(Operator.NOT_EQUAL, "Report 1") is not c
+
+    # Values that compare equal but have different types are not shared
+    assert type(match.get_comparator(Operator.EQUAL, 1).value) is int
+    assert type(match.get_comparator(Operator.EQUAL, True).value) is bool
+
+    # Unhashable values get a new comparator
+    assert match.get_comparator(Operator.EQUAL, ["a"]) == match.Comparator(Operator.EQUAL, ["a"])
+    assert match.get_comparator(Operator.EQUAL, ["a"]) is not match.get_comparator(Operator.EQUAL, ["a"])
 
 class TestSheetMatch:
 
-    def test_cell_match_sheet_match_notfound(self):
-        wb = get_test_workbook()
+    def test_cell_match_sheet_match_notfound(self, any_workbook):
+        wb = any_workbook
         
-        m = match.CellMatch(name="Test", sheet=match.Comparator(match.Operator.EQUAL, "foobar"), reference="A1")
+        m = match.CellMatch(name="Test", sheet=match.get_comparator(Operator.EQUAL, "foobar"), reference="A1")
 
         ws, s = m.get_sheet(wb)
 
         assert s is None
         assert ws is None
 
-    def test_cell_match_sheet_match_equals(self):
-        wb = get_test_workbook()
-        m = match.CellMatch(name="Test", sheet=match.Comparator(match.Operator.EQUAL, "Report 1"), reference="A1")
+    def test_cell_match_sheet_match_equals(self, any_workbook):
+        wb = any_workbook
+        m = match.CellMatch(name="Test", sheet=match.get_comparator(Operator.EQUAL, "Report 1"), reference="A1")
 
         ws, s = m.get_sheet(wb)
 
@@ -317,9 +480,9 @@ class TestSheetMatch:
         assert ws.title == "Report 1"
         assert ws.parent is wb
 
-    def test_cell_match_sheet_match_regex(self):
-        wb = get_test_workbook()
-        m = match.CellMatch(name="Test", sheet=match.Comparator(match.Operator.REGEX, "Report (.+)"), reference="A1")
+    def test_cell_match_sheet_match_regex(self, any_workbook):
+        wb = any_workbook
+        m = match.CellMatch(name="Test", sheet=match.get_comparator(Operator.REGEX, "Report (.+)"), reference="A1")
 
         ws, s = m.get_sheet(wb)
 
@@ -327,10 +490,20 @@ class TestSheetMatch:
         assert ws.title == "Report 1"
         assert ws.parent is wb
 
+    def test_cell_match_sheet_match_equals_worksheets_only(self, workbook):
+        wb = workbook
+        wb.create_chartsheet("Chart")
+
+        m = match.CellMatch(name="Test", sheet=match.get_comparator(Operator.EQUAL, "Chart"), reference="A1")
+        assert m.get_sheet(wb) == (None, None)
+
+        m = match.CellMatch(name="Test", sheet=match.get_comparator(Operator.EQUAL, "report 1"), reference="A1")
+        assert m.get_sheet(wb) == (None, None)
+
 class TestCellMatch:
 
-    def test_find_by_reference_cell(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_cell(self, any_workbook):
+        wb = any_workbook
         m = match.CellMatch(name="Test", reference="'Report 1'!B3")
         
         v, s = m.match(wb)
@@ -338,11 +511,11 @@ class TestCellMatch:
         assert v.cell.value == "Date"
         assert s == "Date"
     
-    def test_find_by_reference_not_found(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_not_found(self, any_workbook):
+        wb = any_workbook
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
             reference="notfound")
         
         v, s = m.match(wb)
@@ -350,11 +523,11 @@ class TestCellMatch:
         assert v is None
         assert s is None
 
-    def test_find_by_reference_cell_with_different_sheet(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_cell_with_different_sheet(self, any_workbook):
+        wb = any_workbook
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 2"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 2"),
             reference="'Report 1'!B3"
         )
         
@@ -363,11 +536,11 @@ class TestCellMatch:
         assert v.cell.value == "Date"
         assert s == "Date"
 
-    def test_find_by_reference_cell_with_sheet(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_cell_with_sheet(self, any_workbook):
+        wb = any_workbook
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
             reference="B3"
         )
         
@@ -376,8 +549,8 @@ class TestCellMatch:
         assert v.cell.value == "Date"
         assert s == "Date"
 
-    def test_find_by_reference_range(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_range(self, any_workbook):
+        wb = any_workbook
         m = match.CellMatch(name="Test", reference="'Report 1'!A3:B3")
         
         v, s = m.match(wb)
@@ -385,16 +558,16 @@ class TestCellMatch:
         assert v is None
         assert s is None
 
-    def test_find_by_reference_named(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_named(self, any_workbook):
+        wb = any_workbook
         m = match.CellMatch(name="Test", reference="DATE_CELL")
         v, s = m.match(wb)
 
         assert v.cell.value == datetime.datetime(2021, 5, 1, 0, 0)
         assert s == datetime.datetime(2021, 5, 1, 0, 0)
     
-    def test_find_by_reference_named_range(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_named_range(self, any_workbook):
+        wb = any_workbook
         m = match.CellMatch(name="Test", reference="PROFIT_RANGE")
         
         v, s = m.match(wb)
@@ -402,11 +575,11 @@ class TestCellMatch:
         assert v is None
         assert s is None
 
-    def test_find_by_reference_table(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_table(self, workbook):
+        wb = workbook
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 2"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 2"),
             reference="RangleTable"
         )
         
@@ -415,13 +588,13 @@ class TestCellMatch:
         assert v is None
         assert s is None
 
-    def test_find_by_value_string(self):
-        wb = get_test_workbook()
+    def test_find_by_value_string(self, any_workbook):
+        wb = any_workbook
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "Date")
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Date")
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'B3'
@@ -429,20 +602,20 @@ class TestCellMatch:
         assert s == "Date"
 
         m = match.CellMatch(name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "notfound")
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "notfound")
         )
         v, s = m.match(wb)
         assert v is None
         assert s is None
 
-    def test_find_by_value_regex(self):
-        wb = get_test_workbook()
+    def test_find_by_value_regex(self, any_workbook):
+        wb = any_workbook
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.REGEX, "^Da(.+)")
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.REGEX, "^Da(.+)")
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'B3'
@@ -450,20 +623,20 @@ class TestCellMatch:
         assert s == "te"
 
         m = match.CellMatch(name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.REGEX, "^Da$")
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.REGEX, "^Da$")
         )
         v, s = m.match(wb)
         assert v is None
         assert s is None
 
-    def test_find_by_value_empty(self):
-        wb = get_test_workbook()
+    def test_find_by_value_empty(self, any_workbook):
+        wb = any_workbook
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EMPTY)
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EMPTY)
         )
         v, s = m.match(wb)
 
@@ -471,13 +644,13 @@ class TestCellMatch:
         assert v.cell.value is None
         assert s == ""
 
-    def test_find_by_value_empty_bounded(self):
-        wb = get_test_workbook()
+    def test_find_by_value_empty_bounded(self, any_workbook):
+        wb = any_workbook
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EMPTY),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EMPTY),
             min_row=3,
             min_col=2
         )
@@ -487,13 +660,108 @@ class TestCellMatch:
         assert v.cell.value is None
         assert s == ""
 
-    def test_find_by_value_not_empty(self):
-        wb = get_test_workbook()
+    def test_find_by_value_empty_beyond_used_area(self, any_workbook):
+        wb = any_workbook
 
+        # Search area is within the used area
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.NOT_EMPTY)
+            sheet=match.get_comparator(Operator.EQUAL, "Report 3"),
+            value=match.get_comparator(Operator.EMPTY),
+            min_row=3,
+            max_row=5,
+        )
+        v, s = m.match(wb)
+        
+        assert v is None
+        assert s is None
+
+        # Search area continues to the right of the used area
+        m = match.CellMatch(
+            name="Test",
+            sheet=match.get_comparator(Operator.EQUAL, "Report 3"),
+            value=match.get_comparator(Operator.EMPTY),
+            min_row=3,
+            min_col=2,
+            max_col=10,
+        )
+        v, s = m.match(wb)
+        
+        assert v.cell.coordinate == 'F3'
+        assert s == ""
+
+        # Search area continues below the used area
+        m = match.CellMatch(
+            name="Test",
+            sheet=match.get_comparator(Operator.EQUAL, "Report 3"),
+            value=match.get_comparator(Operator.EMPTY),
+            min_row=3,
+            max_row=20,
+            max_col=5,
+        )
+        v, s = m.match(wb)
+        
+        assert v.cell.coordinate == 'A6'
+        assert s == ""
+
+        # Search area is entirely outside the used area
+        m = match.CellMatch(
+            name="Test",
+            sheet=match.get_comparator(Operator.EQUAL, "Report 3"),
+            value=match.get_comparator(Operator.EMPTY),
+            min_row=10,
+            min_col=3,
+            max_row=20,
+            max_col=10,
+        )
+        v, s = m.match(wb)
+        
+        assert v.cell.coordinate == 'C10'
+        assert s == ""
+
+    def test_find_by_value_does_not_scan_beyond_used_area(self, workbook):
+        wb = workbook
+        ws = wb['Report 1']
+
+        m = match.CellMatch(
+            name="Test",
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.GREATER, 1000),
+            max_row=10000,
+            max_col=100,
+        )
+        v, s = m.match(wb)
+        
+        assert v is None
+        assert s is None
+        assert ws.max_row == 13
+        assert ws.max_column == 6
+
+    def test_find_by_value_reads_dimensions_once(self, workbook, monkeypatch):
+        ws = workbook['Report 1']
+        calls = []
+
+        max_row = type(ws).max_row
+        monkeypatch.setattr(type(ws), 'max_row', property(lambda self: calls.append('max_row') or max_row.fget(self)))
+
+        m = match.CellMatch(
+            name="Test",
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Gamma"),
+        )
+        position, s = m.find_position_by_value(ws)
+
+        assert position == (9, 2,)
+        assert s == "Gamma"
+        assert calls == ['max_row']
+
+    def test_find_by_value_not_empty(self, any_workbook):
+        wb = any_workbook
+
+        m = match.CellMatch(
+            name="Test",
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.NOT_EMPTY)
         )
         v, s = m.match(wb)
         
@@ -501,13 +769,13 @@ class TestCellMatch:
         assert v.cell.value == "Date"
         assert s == "Date"
 
-    def test_find_by_value_not_empty_bounded(self):
-        wb = get_test_workbook()
+    def test_find_by_value_not_empty_bounded(self, any_workbook):
+        wb = any_workbook
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.NOT_EMPTY),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.NOT_EMPTY),
             min_row=4,
             min_col=2
         )
@@ -517,13 +785,13 @@ class TestCellMatch:
         assert v.cell.value == "Jan"
         assert s == "Jan"
 
-    def test_find_by_value_numeric(self):
-        wb = get_test_workbook()
+    def test_find_by_value_numeric(self, any_workbook):
+        wb = any_workbook
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.GREATER, 6)
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.GREATER, 6)
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'E6'
@@ -532,8 +800,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.GREATER_EQUAL, 6)
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.GREATER_EQUAL, 6)
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'D6'
@@ -542,8 +810,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, 4.6)
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, 4.6)
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'F6'
@@ -552,8 +820,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.LESS, 1.5)
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.LESS, 1.5)
         )
         v, s = m.match(wb)
         assert v is None
@@ -561,8 +829,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.LESS, 2)
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.LESS, 2)
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'C6'
@@ -571,8 +839,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.LESS_EQUAL, 1.5)
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.LESS_EQUAL, 1.5)
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'C6'
@@ -581,8 +849,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.NOT_EQUAL, 1.5),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.NOT_EQUAL, 1.5),
             min_row=6,
             min_col=3,
             max_row=9,
@@ -593,13 +861,13 @@ class TestCellMatch:
         assert v.cell.value == 6
         assert s == 6
 
-    def test_find_by_value_datetime(self):
-        wb = get_test_workbook()
+    def test_find_by_value_datetime(self, any_workbook):
+        wb = any_workbook
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, datetime.datetime(2021, 5, 1))
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, datetime.datetime(2021, 5, 1))
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'C3'
@@ -608,8 +876,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.GREATER, datetime.datetime(2021, 5, 1))
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.GREATER, datetime.datetime(2021, 5, 1))
         )
         v, s = m.match(wb)
         assert v is None
@@ -617,8 +885,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.GREATER_EQUAL, datetime.datetime(2021, 5, 1))
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.GREATER_EQUAL, datetime.datetime(2021, 5, 1))
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'C3'
@@ -627,8 +895,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.LESS, datetime.datetime(2021, 5, 1))
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.LESS, datetime.datetime(2021, 5, 1))
         )
         v, s = m.match(wb)
         assert v is None
@@ -636,21 +904,21 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.LESS_EQUAL, datetime.datetime(2021, 5, 1))
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.LESS_EQUAL, datetime.datetime(2021, 5, 1))
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'C3'
         assert v.cell.value == datetime.datetime(2021, 5, 1)
         assert s == datetime.datetime(2021, 5, 1)
     
-    def test_find_by_value_datet(self):
-        wb = get_test_workbook()
+    def test_find_by_value_datet(self, any_workbook):
+        wb = any_workbook
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, datetime.date(2021, 5, 1))
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, datetime.date(2021, 5, 1))
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'C3'
@@ -659,8 +927,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.GREATER, datetime.date(2021, 5, 1))
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.GREATER, datetime.date(2021, 5, 1))
         )
         v, s = m.match(wb)
         assert v is None
@@ -668,8 +936,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.GREATER_EQUAL, datetime.date(2021, 5, 1))
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.GREATER_EQUAL, datetime.date(2021, 5, 1))
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'C3'
@@ -678,8 +946,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.LESS, datetime.date(2021, 5, 1))
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.LESS, datetime.date(2021, 5, 1))
         )
         v, s = m.match(wb)
         assert v is None
@@ -687,21 +955,21 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.LESS_EQUAL, datetime.date(2021, 5, 1))
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.LESS_EQUAL, datetime.date(2021, 5, 1))
         )
         v, s = m.match(wb)
         assert v.cell.coordinate == 'C3'
         assert v.cell.value == datetime.datetime(2021, 5, 1)
         assert s == datetime.datetime(2021, 5, 1)
 
-    def test_offset(self):
-        wb = get_test_workbook()
+    def test_offset(self, any_workbook):
+        wb = any_workbook
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "Date"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Date"),
             col_offset=1,
         )
         v, s = m.match(wb)
@@ -712,8 +980,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "Date"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Date"),
             col_offset=1,
             row_offset=2
         )
@@ -723,13 +991,13 @@ class TestCellMatch:
         assert v.cell.value == "Jan"
         assert s == "Date"
     
-    def test_boundry_match(self):
-        wb = get_test_workbook()
+    def test_boundry_match(self, any_workbook):
+        wb = any_workbook
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "Date"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Date"),
         )
 
         v, s = m.match(wb)
@@ -740,8 +1008,8 @@ class TestCellMatch:
         # not found within boundary
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "Date"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Date"),
             min_row=4,
             min_col=4,
             max_row=6,
@@ -755,8 +1023,8 @@ class TestCellMatch:
         # not found within partial boundary
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "Date"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Date"),
             min_row=4,
             min_col=4,
         )
@@ -768,8 +1036,8 @@ class TestCellMatch:
         # found within boundary
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "Date"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Date"),
             min_row=2,
             min_col=2,
             max_row=6,
@@ -784,8 +1052,8 @@ class TestCellMatch:
         # found within partial boundary
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "Date"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Date"),
             min_row=2,
             min_col=2,
         )
@@ -797,8 +1065,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "Date"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Date"),
             max_row=6,
             max_col=6,
         )
@@ -810,8 +1078,8 @@ class TestCellMatch:
 
         m = match.CellMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
-            value=match.Comparator(match.Operator.EQUAL, "Date"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            value=match.get_comparator(Operator.EQUAL, "Date"),
             min_row=1,
         )
 
@@ -822,8 +1090,8 @@ class TestCellMatch:
 
 class TestRangeMatch:
 
-    def test_find_by_reference_cell(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_cell(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(name="Test", reference="'Report 1'!B3")
         
         v, s = m.match(wb)
@@ -831,11 +1099,11 @@ class TestRangeMatch:
         assert v.get_values() == (("Date",),)
         assert s is None
 
-    def test_find_by_reference_cell_with_different_sheet(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_cell_with_different_sheet(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 2"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 2"),
             reference="'Report 1'!B3"
         )
         
@@ -844,11 +1112,11 @@ class TestRangeMatch:
         assert v.get_values() == (("Date",),)
         assert s is None
 
-    def test_find_by_reference_cell_with_sheet(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_cell_with_sheet(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
             reference="B3"
         )
         
@@ -857,8 +1125,8 @@ class TestRangeMatch:
         assert v.get_values() == (("Date",),)
         assert s is None
 
-    def test_find_by_reference_range(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_range(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(name="Test", reference="'Report 1'!A3:B3")
         
         v, s = m.match(wb)
@@ -866,8 +1134,8 @@ class TestRangeMatch:
         assert v.get_values() == ((None, "Date",),)
         assert s is None
     
-    def test_find_by_reference_range_2d(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_range_2d(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(name="Test", reference="'Report 1'!$C$5:$D$6")
         
         v, s = m.match(wb)
@@ -878,16 +1146,16 @@ class TestRangeMatch:
         )
         assert s is None
 
-    def test_find_by_reference_named_cell(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_named_cell(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(name="Test", reference="DATE_CELL")
         v, s = m.match(wb)
 
         assert v.get_values() == ((datetime.datetime(2021, 5, 1, 0, 0),),)
         assert s is None
     
-    def test_find_by_reference_named_range(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_named_range(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(name="Test", reference="PROFIT_RANGE")
         
         v, s = m.match(wb)
@@ -901,11 +1169,11 @@ class TestRangeMatch:
         )
         assert s is None
 
-    def test_find_by_reference_table(self):
-        wb = get_test_workbook()
+    def test_find_by_reference_table(self, workbook):
+        wb = workbook
         m = match.RangeMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 2"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 2"),
             reference="RangleTable"
         )
         
@@ -919,11 +1187,11 @@ class TestRangeMatch:
         )
         assert s is None
 
-    def test_find_by_start_cell_not_found(self):
-        wb = get_test_workbook()
+    def test_find_by_start_cell_not_found(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
             start_cell=match.CellMatch(name="Test:Start", reference="notfound"),
             rows=4,
             cols=3
@@ -934,11 +1202,11 @@ class TestRangeMatch:
         assert v is None
         assert s is None
 
-    def test_find_by_start_cell_and_size(self):
-        wb = get_test_workbook()
+    def test_find_by_start_cell_and_size(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
             start_cell=match.CellMatch(name="Test:Start", reference="'Report 1'!B5"),
             rows=4,
             cols=3
@@ -954,14 +1222,35 @@ class TestRangeMatch:
         )
         assert s is None
 
-    def test_find_by_start_cell_and_size_with_match(self):
-        wb = get_test_workbook()
+    def test_find_by_start_cell_and_size_beyond_used_area(self, any_workbook):
+        # Read-only sheets end at the last used row, but the range keeps its size
+        wb = any_workbook
         m = match.RangeMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            start_cell=match.CellMatch(name="Test:Start", reference="B13"),
+            rows=3,
+            cols=2,
+        )
+
+        v, s = m.match(wb)
+
+        assert v.get_reference() == "'Report 1'!$B$13:$C$15"
+        assert v.get_values() == (
+            ('target', 'output',),
+            (None, None,),
+            (None, None,),
+        )
+        assert s == 'target'
+
+    def test_find_by_start_cell_and_size_with_match(self, any_workbook):
+        wb = any_workbook
+        m = match.RangeMatch(
+            name="Test",
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
             start_cell=match.CellMatch(
                 name="Test:Start",
-                value=match.Comparator(operator=match.Operator.EQUAL, value="Jan"),
+                value=match.get_comparator(operator=Operator.EQUAL, value="Jan"),
                 col_offset=-1
             ),
             rows=4,
@@ -978,19 +1267,19 @@ class TestRangeMatch:
         )
         assert s == "Jan"
     
-    def test_find_by_start_cell_and_end_cell_with_match(self):
-        wb = get_test_workbook()
+    def test_find_by_start_cell_and_end_cell_with_match(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
             start_cell=match.CellMatch(
                 name="Test:Start",
-                value=match.Comparator(operator=match.Operator.EQUAL, value="Jan"),
+                value=match.get_comparator(operator=Operator.EQUAL, value="Jan"),
                 col_offset=-1
             ),
             end_cell=match.CellMatch(
                 name="Test:End",
-                value=match.Comparator(operator=match.Operator.EQUAL, value=13),
+                value=match.get_comparator(operator=Operator.EQUAL, value=13),
             ),
         )
         
@@ -1004,19 +1293,19 @@ class TestRangeMatch:
         )
         assert s == "Jan"
     
-    def test_find_by_start_cell_and_end_cell_not_found(self):
-        wb = get_test_workbook()
+    def test_find_by_start_cell_and_end_cell_not_found(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
             start_cell=match.CellMatch(
                 name="Test:Start",
-                value=match.Comparator(operator=match.Operator.EQUAL, value="Jan"),
+                value=match.get_comparator(operator=Operator.EQUAL, value="Jan"),
                 col_offset=-1
             ),
             end_cell=match.CellMatch(
                 name="Test:End",
-                value=match.Comparator(operator=match.Operator.EQUAL, value=-99),
+                value=match.get_comparator(operator=Operator.EQUAL, value=-99),
             ),
         )
         
@@ -1025,11 +1314,11 @@ class TestRangeMatch:
         assert v is None
         assert s is None
     
-    def test_find_by_start_cell_contiguous(self):
-        wb = get_test_workbook()
+    def test_find_by_start_cell_contiguous(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
             start_cell=match.CellMatch(name="Test:Start",reference="C5")
         )
         
@@ -1044,11 +1333,29 @@ class TestRangeMatch:
         )
         assert s == "Jan"
     
-    def test_find_by_start_cell_contiguous_first_blank(self):
-        wb = get_test_workbook()
+    def test_find_by_start_cell_contiguous_to_edge(self, any_workbook):
+        wb = any_workbook
+        m = match.RangeMatch(
+            name="Test",
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
+            start_cell=match.CellMatch(name="Test:Start",reference="E6")
+        )
+
+        v, s = m.match(wb)
+
+        assert v.get_values() == (
+            (11, 4.6,),
+            (12, 4.7,),
+            (13, 4.8,),
+            (14, 4.9,),
+        )
+        assert s == 11
+
+    def test_find_by_start_cell_contiguous_first_blank(self, any_workbook):
+        wb = any_workbook
         m = match.RangeMatch(
             name="Test",
-            sheet=match.Comparator(match.Operator.EQUAL, "Report 1"),
+            sheet=match.get_comparator(Operator.EQUAL, "Report 1"),
             start_cell=match.CellMatch(name="Test:Start",reference="B5")
         )
         
@@ -1,14 +1,22 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Union, Tuple, Generator
 
 from openpyxl.workbook.defined_name import DefinedName
 from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.table import Table
 from openpyxl.cell import Cell
+from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL
 
 from openpyxl.utils.cell import absolute_coordinate, quote_sheetname
 from openpyxl.worksheet.worksheet import Worksheet
 
+def locate_empty_cell(cell : Cell, sheet : Worksheet, row : int, column : int) -> Cell:
+    """Read-only worksheets return a shared `EmptyCell` placeholder, which has no
+    sheet or position, for blank cells. Replace it with a blank cell at `row` and
+    `column` in `sheet`.
+    """
+    return ReadOnlyCell(sheet, row, column, None) if cell is EMPTY_CELL else cell
+
 @dataclass
 class Range:
     """One or multiple contiguous cells, possibly identified by a name,
@@ -20,21 +28,71 @@ class Range:
     defined_name : DefinedName = None
     named_table : Table = None
 
+    # Dimensions, worked out once as the cells do not change. Both are 0 if
+    # the range is empty.
+    rows : int = field(default=0, init=False, repr=False, compare=False)
+    columns : int = field(default=0, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         assert not (self.defined_name is not None and self.named_table is not None), \
             "A results range cannot have both a defined name and a table name"
 
+        if len(self.cells) > 0 and len(self.cells[0]) > 0:
+            self.rows = len(self.cells)
+            self.columns = len(self.cells[0])
+
+    @classmethod
+    def from_bounds(
+        cls, sheet : Worksheet, min_row : int, min_col : int, max_row : int, max_col : int,
+        defined_name : DefinedName = None, named_table : Table = None
+    ) -> "Range":
+        """Build a range from the cells of `sheet` within the given (inclusive)
+        bounds, reading them in a single pass over the rows.
+        """
+        cells = [
+            tuple(
+                locate_empty_cell(cell, sheet, row, column)
+                for column, cell in enumerate(cells, start=min_col)
+            )
+            for row, cells in enumerate(
+                sheet.iter_rows(min_row=min_row, min_col=min_col, max_row=max_row, max_col=max_col),
+                start=min_row
+            )
+        ]
+
+        # Read-only worksheets stop at the last row of their used area, so
+        # fill in blank cells for any rows or columns beyond it
+        columns = max_col - min_col + 1
+        for row, row_cells in enumerate(cells, start=min_row):
+            if len(row_cells) < columns:
+                cells[row - min_row] = row_cells + tuple(
+                    locate_empty_cell(EMPTY_CELL, sheet, row, column)
+                    for column in range(min_col + len(row_cells), max_col + 1)
+                )
+
+        for row in range(min_row + len(cells), max_row + 1):
+            cells.append(tuple(
+                locate_empty_cell(EMPTY_CELL, sheet, row, column)
+                for column in range(min_col, max_col + 1)
+            ))
+
+        return cls(
+            tuple(cells),
+            defined_name=defined_name,
+            named_table=named_table,
+        )
+
     @property
     def is_empty(self) -> bool:
-        return len(self.cells) == 0 or len(self.cells[0]) == 0
+        return self.columns == 0
 
     @property
     def is_cell(self) -> bool:
-        return not self.is_empty and len(self.cells) == 1 and len(self.cells[0]) == 1
+        return self.rows == 1 and self.columns == 1
     
     @property
     def is_range(self) -> bool:
-        return not self.is_empty and (len(self.cells) > 1 or len(self.cells[0]) > 1)
+        return self.rows > 1 or self.columns > 1
 
     @property
     def cell(self) -> Cell:
@@ -42,27 +100,19 @@ class Range:
     
     @property
     def first_cell(self) -> Cell:
-        return self.cells[0][0] if not self.is_empty else None
+        return self.cells[0][0] if self.columns != 0 else None
     
     @property
     def last_cell(self) -> Cell:
-        return self.cells[-1][-1] if not self.is_empty else None
-
-    @property
-    def rows(self) -> int:
-        return len(self.cells) if not self.is_empty else 0
-    
-    @property
-    def columns(self) -> int:
-        return len(self.cells[0]) if not self.is_empty else 0
+        return self.cells[-1][-1] if self.columns != 0 else None
 
     @property
     def sheet(self) -> Worksheet:
-        return self.cells[0][0].parent if not self.is_empty else None
+        return self.cells[0][0].parent if self.columns != 0 else None
     
     @property
     def workbook(self) -> Workbook:
-        return self.cells[0][0].parent.parent if not self.is_empty else None
+        return self.cells[0][0].parent.parent if self.columns != 0 else None
 
     def get_reference(self, absolute=True, use_sheet=True, use_defined_name=True, use_named_table=True) -> str:
         if self.is_empty:
@@ -84,6 +134,8 @@ class Range:
         return prefix + start + ":" + end
 
     def get_values(self) -> Tuple[Tuple[Cell]]:
-        return tuple(
-            tuple(c.value for c in r) for r in self.cells
-        )
+        # The cells are already loaded, so read their values rather than the
+        # sheet. List comprehensions are quicker than generators here.
+        return tuple([
+            tuple([c.value for c in r]) for r in self.cells
+        ])
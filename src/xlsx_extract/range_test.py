@@ -1,12 +1,10 @@
 import datetime
-import os.path
-import openpyxl
 
 from . import range, utils
+from .testing import load_test_workbook
 
 def get_test_workbook():
-    filename = os.path.join(os.path.dirname(__file__), 'test_data', 'source.xlsx')
-    return openpyxl.load_workbook(filename, data_only=True)
+    return load_test_workbook('source.xlsx', data_only=True)
 
 class TestRange:
 
@@ -27,9 +25,17 @@ class TestRange:
 
         assert r.get_reference() is None
         assert r.get_values() == ()
+
+        # A row without columns is empty too
+        r = range.Range(((),))
+
+        assert r.is_empty
+        assert not r.is_range
+        assert r.rows == 0
+        assert r.columns == 0
     
-    def test_single_cell(self):
-        wb = get_test_workbook()
+    def test_single_cell(self, any_workbook):
+        wb = any_workbook
         ws = wb['Report 1']
         cells = ws['B3:B3']
 
@@ -81,8 +87,56 @@ class TestRange:
             ('Date', datetime.datetime(2021, 5, 1),),
         )
     
-    def test_defined_name(self):
+    def test_from_bounds(self):
         wb = get_test_workbook()
+        ws = wb['Report 1']
+
+        r = range.Range.from_bounds(ws, 2, 2, 3, 3)
+
+        assert r.is_range
+        assert r.sheet is ws
+        assert r.rows == 2
+        assert r.columns == 2
+        assert r.first_cell is ws['B2']
+        assert r.last_cell is ws['C3']
+
+        assert r.get_reference() == "'Report 1'!$B$2:$C$3"
+        assert r.get_values() == (
+            (None, None,),
+            ('Date', datetime.datetime(2021, 5, 1),),
+        )
+
+        r = range.Range.from_bounds(ws, 3, 2, 3, 2)
+
+        assert r.is_cell
+        assert r.cell is ws['B3']
+
+    def test_from_bounds_beyond_used_area(self, any_workbook):
+        ws = any_workbook['Report 1']
+
+        # The used area ends at row 13 and column F
+        r = range.Range.from_bounds(ws, 12, 1, 15, 7)
+
+        assert r.rows == 4
+        assert r.columns == 7
+        assert r.sheet is ws
+        assert r.get_reference() == "'Report 1'!$A$12:$G$15"
+        assert r.last_cell.coordinate == 'G15'
+        assert r.get_values() == (
+            (None, 'source', 'input', None, None, None, None,),
+            (None, 'target', 'output', None, None, None, None,),
+            (None,) * 7,
+            (None,) * 7,
+        )
+
+        r = range.Range.from_bounds(ws, 20, 8, 20, 8)
+
+        assert r.is_cell
+        assert r.cell.coordinate == 'H20'
+        assert r.cell.value is None
+
+    def test_defined_name(self, any_workbook):
+        wb = any_workbook
 
         r = utils.get_range("PROFIT_RANGE", wb)
 
@@ -1,12 +1,11 @@
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, Union, Tuple
 
 from openpyxl import Workbook
 from openpyxl.cell import Cell
 
 from .range import Range
-from .match import Match, CellMatch, RangeMatch, Comparator, Operator
+from .match import Match, CellMatch, RangeMatch, Operator, get_comparator
 from .utils import copy_value, triangulate_cell, update_table, replace_vector, align_vectors
 
 def locate_cell_in_range(workbook : Workbook, range_cells : Range, cell_match : CellMatch) -> Cell:
@@ -16,15 +15,19 @@ def locate_cell_in_range(workbook : Workbook, range_cells : Range, cell_match :
     if range_cells is None or range_cells.is_empty:
         return None
 
-    m = deepcopy(cell_match)
-                
-    m.min_row = range_cells.first_cell.row
-    m.min_col = range_cells.first_cell.column
-    m.max_row = range_cells.last_cell.row
-    m.max_col = range_cells.last_cell.column
-
-    if m.sheet is None and range_cells.sheet is not None:
-        m.sheet = Comparator(Operator.EQUAL, range_cells.sheet.title)
+    sheet = cell_match.sheet
+    if sheet is None and range_cells.sheet is not None:
+        sheet = get_comparator(Operator.EQUAL, range_cells.sheet.title)
+
+    # A shallow copy is enough: only the search area and sheet change, and
+    # comparators are immutable
+    m = replace(cell_match,
+        sheet=sheet,
+        min_row=range_cells.first_cell.row,
+        min_col=range_cells.first_cell.column,
+        max_row=range_cells.last_cell.row,
+        max_col=range_cells.last_cell.column,
+    )
 
     cell_range, _ = m.match(workbook)
 
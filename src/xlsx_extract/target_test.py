@@ -1,8 +1,6 @@
 from datetime import datetime
-import os.path
 
 import pytest
-import openpyxl
 
 from .match import (
     Operator,
@@ -10,52 +8,63 @@ from .match import (
     CellMatch,
     RangeMatch
 )
-from .target import Target
+from .target import Target, locate_cell_in_range
 from .range import Range
+from .testing import load_test_workbook, requires_assertions
 
 def get_test_workbook(filename='source.xlsx', data_only=True):
-    filename = os.path.join(os.path.dirname(__file__), 'test_data', filename)
-    return openpyxl.load_workbook(filename, data_only=data_only)
+    return load_test_workbook(filename, data_only=data_only)
 
-class TestInit:
+# Matches shared by the constructor tests. `Target` only changes the matches
+# it is given when they have a sheet, so these are safe to share.
 
-    def test_construct_target(self):
-        Target(
-            source=CellMatch(name="Source", reference="SourceRef"),
-            target=CellMatch(name="Target", reference="TargetRef"),
-        )
+@pytest.fixture(scope="session")
+def source_cell():
+    return CellMatch(name="Source", reference="SourceRef")
 
-        Target(
-            source=RangeMatch(name="Source", reference="SourceRef"),
-            target=RangeMatch(name="Target", reference="TargetRef"),
-        )
+@pytest.fixture(scope="session")
+def target_cell():
+    return CellMatch(name="Target", reference="TargetRef")
+
+@pytest.fixture(scope="session")
+def source_range():
+    return RangeMatch(name="Source", reference="SourceRef")
+
+@pytest.fixture(scope="session")
+def target_range():
+    return RangeMatch(name="Target", reference="TargetRef")
+
+class TestInit:
+
+    def test_construct_target(self, source_cell, target_cell, source_range, target_range):
+        Target(source=source_cell, target=target_cell)
+        Target(source=source_range, target=target_range)
 
-        with pytest.raises(AssertionError):
-            Target(
-                source=RangeMatch(name="Source", reference="SourceRef"),
-                target=CellMatch(name="Target", reference="TargetRef"),
-            )
-        
         Target(
-            source=RangeMatch(name="Source", reference="SourceRef"),
-            target=CellMatch(name="Target", reference="TargetRef"),
+            source=source_range,
+            target=target_cell,
             source_col=CellMatch("S1", reference="C1"),
             source_row=CellMatch("S2", reference="C2"),
         )
 
-        with pytest.raises(AssertionError):
-            Target(
-                source=CellMatch(name="Source", reference="SourceRef"),
-                target=RangeMatch(name="Target", reference="TargetRef"),
-            )
-        
         Target(
-            source=CellMatch(name="Source", reference="SourceRef"),
-            target=RangeMatch(name="Target", reference="TargetRef"),
+            source=source_cell,
+            target=target_range,
             target_col=CellMatch("S1", reference="C1"),
             target_row=CellMatch("S2", reference="C2"),
         )
 
+    @requires_assertions
+    def test_construct_target_invalid(self, source_cell, target_cell, source_range, target_range):
+
+        # Range -> Cell needs source row and column
+        with pytest.raises(AssertionError):
+            Target(source=source_range, target=target_cell)
+
+        # Cell -> Range needs target row and column
+        with pytest.raises(AssertionError):
+            Target(source=source_cell, target=target_range)
+
     def test_init_copies_sheet_match(self):
         source_sheet = Comparator(operator=Operator.EQUAL, value="S")
         target_sheet = Comparator(operator=Operator.EQUAL, value="T")
@@ -106,6 +115,20 @@ def test_single_cell_triangulated_source():
 
     assert target_wb['Summary']['C3'].value == 7
 
+def test_locate_cell_in_range():
+    source_wb = get_test_workbook('source.xlsx')
+    source = Range(source_wb['Report 1']['B5:F9'])
+
+    m = CellMatch("", value=Comparator(Operator.EQUAL, "Beta"))
+    assert locate_cell_in_range(source_wb, source, m).coordinate == 'B7'
+
+    # The match is not changed
+    assert m.sheet is None
+    assert (m.min_row, m.min_col, m.max_row, m.max_col,) == (None, None, None, None,)
+
+    # Cells outside the range are not found
+    assert locate_cell_in_range(source_wb, source, CellMatch("", value=Comparator(Operator.EQUAL, "Date"))) is None
+
 def test_single_cell_triangulated_target():
     source_wb = get_test_workbook('source.xlsx')
     target_wb = get_test_workbook('target.xlsx', data_only=False)
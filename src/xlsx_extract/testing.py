@@ -0,0 +1,31 @@
+import os.path
+import pickle
+import pytest
+import openpyxl
+
+# Validation is done with `assert`, which `python -O` strips out, so tests that
+# only check that invalid input is rejected cannot pass in that mode
+requires_assertions = pytest.mark.skipif(not __debug__, reason="assertions are disabled")
+
+# Pickled copies of the workbooks parsed so far, keyed by `(filename, data_only)`
+workbook_snapshots = {}
+
+def load_test_workbook(filename='source.xlsx', data_only=True, read_only=False):
+    """Load a workbook from the `test_data` directory.
+
+    Each file is only parsed once per test session. Editable workbooks are
+    returned as a fresh copy of a pickled snapshot, so tests are free to
+    modify them.
+    """
+    path = os.path.join(os.path.dirname(__file__), 'test_data', filename)
+
+    # Read-only workbooks stream from an open file and cannot be pickled
+    if read_only:
+        return openpyxl.load_workbook(path, data_only=data_only, read_only=True, keep_links=False)
+
+    key = (filename, data_only,)
+    if key not in workbook_snapshots:
+        workbook = openpyxl.load_workbook(path, data_only=data_only, keep_links=False)
+        workbook_snapshots[key] = pickle.dumps(workbook, pickle.HIGHEST_PROTOCOL)
+
+    return pickle.loads(workbook_snapshots[key])
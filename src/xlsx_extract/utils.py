@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Tuple
 
 from openpyxl import Workbook
@@ -7,7 +8,7 @@ from openpyxl.worksheet.table import Table
 from openpyxl.cell import Cell
 from openpyxl.utils.cell import quote_sheetname, range_to_tuple
 
-from .range import Range
+from .range import Range, locate_empty_cell
 
 def get_range(ref : str, workbook : Workbook, worksheet : Worksheet = None) -> Range:
     """Get a Range by a reference, which can be defined name, a named table, or
@@ -42,7 +43,7 @@ def get_range(ref : str, workbook : Workbook, worksheet : Worksheet = None) -> R
     if '!' not in ref:
         return None
 
-    sheet_name, (c1, r1, c2, r2) = range_to_tuple(ref)
+    sheet_name, (c1, r1, c2, r2) = parse_reference(ref)
 
     # Malformed reference
     if None in (r1, c1, r2, c2,):
@@ -51,8 +52,15 @@ def get_range(ref : str, workbook : Workbook, worksheet : Worksheet = None) -> R
     # Might not be the same as `worksheet`
     sheet = workbook[sheet_name]
 
-    cells = tuple(sheet.iter_rows(min_row=r1, min_col=c1, max_row=r2, max_col=c2))
-    return Range(cells, defined_name=defined_name, named_table=named_table)
+    return Range.from_bounds(sheet, r1, c1, r2, c2, defined_name=defined_name, named_table=named_table)
+
+@lru_cache(maxsize=1024)
+def parse_reference(ref : str) -> Tuple[str, Tuple[int, int, int, int]]:
+    """Parse a sheet-qualified range reference into a tuple of
+    `(sheet name, (min col, min row, max col, max row))`. References are
+    usually parsed many times over, so results are cached.
+    """
+    return range_to_tuple(ref)
 
 def get_defined_name(workbook : Workbook, worksheet : Worksheet, name : str) -> DefinedName:
     """Get a locally or globally defined name object
@@ -72,14 +80,13 @@ def get_locally_defined_name(worksheet : Worksheet, name : str) -> DefinedName:
     """
 
     workbook = worksheet.parent
-    
-    sheet_id = workbook.index(worksheet)
-    if name in workbook.defined_names.localnames(sheet_id):
-        defined_name = workbook.defined_names.get(name, sheet_id)
-        if defined_name is not None:
-            return defined_name
-    
-    return None
+
+    # openpyxl < 3.1 keeps all defined names in one list, tagged with a
+    # local sheet id; later versions keep local names on each worksheet
+    if hasattr(workbook.defined_names, 'definedName'):
+        return workbook.defined_names.get(name, workbook.index(worksheet))
+
+    return getattr(worksheet, 'defined_names', {}).get(name, None)
 
 def get_globally_defined_name(workbook : Workbook, name : str) -> DefinedName:
     """Look up a defined name global to the workbook
@@ -91,10 +98,12 @@ def get_named_table(worksheet : Worksheet, name : str) -> Table:
     """Look up a named table
     """
 
-    if worksheet is None or name not in worksheet.tables:
+    # Read-only worksheets do not load named tables
+    tables = getattr(worksheet, 'tables', {})
+    if name not in tables:
         return None
 
-    return worksheet.tables[name]
+    return tables[name]
 
 def add_sheet_to_reference(worksheet : Worksheet, ref : str) -> str:
     """Add worksheet name to table if needed
@@ -104,12 +113,25 @@ def add_sheet_to_reference(worksheet : Worksheet, ref : str) -> str:
         ref = "%s!%s" % (quote_sheetname(worksheet.title), ref)
     return ref
 
+def get_cell(worksheet : Worksheet, row : int, column : int) -> Cell:
+    """Get the cell at `row` and `column`. Unlike `worksheet.cell()`, this
+    gives a cell that knows its position even for blank cells in read-only
+    worksheets.
+    """
+    return locate_empty_cell(worksheet.cell(row=row, column=column), worksheet, row, column)
+
+def offset_cell(cell : Cell, row_offset : int, col_offset : int) -> Cell:
+    """Get the cell offset from `cell` by the given number of rows and columns.
+    Works with read-only cells, which do not have `offset()`.
+    """
+    return get_cell(cell.parent, cell.row + row_offset, cell.column + col_offset)
+
 def triangulate_cell(row : Cell, col : Cell) -> Cell:
     """Find the cell at the intersection of the row of `row`
     and the column of `col`.
     """
     assert row.parent is col.parent
-    return row.parent.cell(row.row, col.column)
+    return get_cell(row.parent, row.row, col.column)
 
 def copy_value(source : Cell, target : Cell):
     """Copy a single value from source to target
@@ -147,16 +169,15 @@ def resize_table(table : Range, rows : int, cols : int) -> Range:
     if cols_delta < 0:
         table.sheet.delete_cols(table.first_cell.column + cols, -cols_delta)
     
-    new_range = tuple(
-        table.sheet.iter_rows(
-            min_row=table.first_cell.row,
-            min_col=table.first_cell.column,
-            max_row=table.first_cell.row + (rows - 1),
-            max_col=table.first_cell.column + (cols - 1)
-        )
+    new_table = Range.from_bounds(
+        table.sheet,
+        min_row=table.first_cell.row,
+        min_col=table.first_cell.column,
+        max_row=table.first_cell.row + (rows - 1),
+        max_col=table.first_cell.column + (cols - 1),
+        defined_name=table.defined_name,
+        named_table=table.named_table,
     )
-    
-    new_table = Range(new_range, defined_name=table.defined_name, named_table=table.named_table)
 
     # Update defined name or named table reference if required
 
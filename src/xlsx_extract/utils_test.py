@@ -1,14 +1,20 @@
+import gc
+import weakref
 import datetime
-import os.path
-import openpyxl
+import pytest
+
+from openpyxl.workbook.defined_name import DefinedName
 
 from .utils import (
     get_range,
+    parse_reference,
     get_globally_defined_name,
     get_defined_name,
     get_named_table,
     add_sheet_to_reference,
     resize_table,
+    get_cell,
+    offset_cell,
     triangulate_cell,
     copy_value,
     update_table,
@@ -18,10 +24,10 @@ from .utils import (
 )
 
 from .range import Range
+from .testing import load_test_workbook
 
 def get_test_workbook(filename='source.xlsx', data_only=True):
-    filename = os.path.join(os.path.dirname(__file__), 'test_data', filename)
-    return openpyxl.load_workbook(filename, data_only=data_only)
+    return load_test_workbook(filename, data_only=data_only)
 
 def test_get_range():
     wb = get_test_workbook()
@@ -50,6 +56,25 @@ def test_get_range():
     assert get_range('NotFound', wb) is None
     assert get_range('NotFound', wb, ws) is None
 
+    with pytest.raises(KeyError):
+        get_range("'Not A Sheet'!A3", wb)
+
+    # Sheets are looked up by their current title
+    wb['Report 1'].title = "Renamed"
+    assert get_range("'Renamed'!A3", wb).sheet is wb['Renamed']
+
+    with pytest.raises(KeyError):
+        get_range("'Report 1'!A3", wb)
+
+def test_parse_reference():
+    parse_reference.cache_clear()
+
+    assert parse_reference("'Report 1'!$A$1:$E$5") == ('Report 1', (1, 1, 5, 5))
+    assert parse_reference("'Report 1'!B3") == ('Report 1', (2, 3, 2, 3))
+    assert parse_reference("'Report 1'!$A$1:$E$5") == ('Report 1', (1, 1, 5, 5))
+
+    assert parse_reference.cache_info().hits == 1
+
 def test_get_globally_defined_name():
     wb = get_test_workbook()
 
@@ -68,14 +93,77 @@ def test_get_named_table():
     ws = wb['Report 2']
 
     assert get_named_table(ws, "RangleTable") is not None
+    assert get_named_table(ws, "RangleTable").ref == "B10:E13"
     assert get_named_table(ws, "NotFound") is None
 
+def test_get_range_after_names_change():
+    wb = get_test_workbook()
+    ws = wb['Report 1']
+
+    assert get_range("NEW_NAME", wb) is None
+    assert get_range("DATE_CELL", wb).first_cell.value == datetime.datetime(2021, 5, 1)
+
+    # Names added after a lookup are found
+    wb.defined_names["NEW_NAME"] = DefinedName("NEW_NAME", attr_text="'Report 1'!$B$3")
+    assert get_range("NEW_NAME", wb).first_cell.value == "Date"
+
+    ws.defined_names["LOCAL_NAME"] = DefinedName("LOCAL_NAME", attr_text="'Report 1'!$C$3")
+    assert get_range("LOCAL_NAME", wb, ws).first_cell.value == datetime.datetime(2021, 5, 1)
+
+    # Removed ones are not, even if another name takes their place
+    del wb.defined_names["DATE_CELL"]
+    wb.defined_names["OTHER_NAME"] = DefinedName("OTHER_NAME", attr_text="'Report 1'!$B$5")
+    assert get_range("DATE_CELL", wb) is None
+    assert get_range("OTHER_NAME", wb).get_reference(use_defined_name=False) == "'Report 1'!$B$5"
+
+    # Names that are changed in place resolve to their new range
+    wb.defined_names["PROFIT_RANGE"] = DefinedName("PROFIT_RANGE", attr_text="'Report 3'!$A$1:$B$2")
+    assert get_range("PROFIT_RANGE", wb).get_reference(use_defined_name=False) == "'Report 3'!$A$1:$B$2"
+
+    wb.defined_names["PROFIT_RANGE"].attr_text = "'Report 3'!$A$1:$C$3"
+    assert get_range("PROFIT_RANGE", wb).get_reference(use_defined_name=False) == "'Report 3'!$A$1:$C$3"
+
 def test_add_sheet_to_reference():
     wb = get_test_workbook()
     ws = wb['Report 1']
 
     assert add_sheet_to_reference(ws, "B3:C4") == "'Report 1'!B3:C4"
 
+def test_get_cell(any_workbook):
+    ws = any_workbook['Report 1']
+
+    c = get_cell(ws, 3, 2)
+    assert c.coordinate == 'B3'
+    assert c.value == "Date"
+
+    # Blank cells in read-only sheets still know their position
+    c = get_cell(ws, 1, 1)
+    assert c.coordinate == 'A1'
+    assert c.parent is ws
+    assert c.value is None
+
+def test_get_cell_does_not_keep_workbook():
+    wb = load_test_workbook(read_only=True)
+    get_cell(wb['Report 1'], 3, 2)
+
+    ref = weakref.ref(wb)
+    wb.close()
+    del wb
+    gc.collect()
+
+    assert ref() is None
+
+def test_offset_cell(any_workbook):
+    ws = any_workbook['Report 1']
+
+    c = offset_cell(get_cell(ws, 3, 2), 2, 1)
+    assert c.coordinate == 'C5'
+    assert c.value == "Jan"
+
+    c = offset_cell(c, -1, -1)
+    assert c.coordinate == 'B4'
+    assert c.value is None
+
 def test_triangulate_cell():
     wb = get_test_workbook()
     ws = wb['Report 1']